@@ -0,0 +1,70 @@
+from pathlib import Path
+from timeit import repeat
+from tempfile import TemporaryDirectory
+from typing import Any, Type, Callable
+
+import numpy as np
+
+from google.protobuf.message import Message as ProtoMessage
+
+from py_grpcio import BaseService, Message, NDArray
+from py_grpcio.method import MethodGRPC
+
+SIZE: int = 1_000_000
+REPEAT: int = 5
+
+
+class ListVector(Message):
+    values: list[float]
+
+
+class PackedVector(Message):
+    values: NDArray[np.float64]
+
+
+class EnvelopeVector(Message):
+    values: NDArray
+
+
+class ArrayService(BaseService):
+    async def echo_list(self, request: ListVector) -> ListVector:
+        return request
+
+    async def echo_packed(self, request: PackedVector) -> PackedVector:
+        return request
+
+    async def echo_envelope(self, request: EnvelopeVector) -> EnvelopeVector:
+        return request
+
+
+def measure(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+def main() -> None:
+    with TemporaryDirectory() as proto_dir:
+        ArrayService.init_protos_and_services(proto_dir=Path(proto_dir), persisted=True)
+    vector: np.ndarray = np.random.rand(SIZE)
+    cases: dict[str, tuple[str, Type[Message], Any]] = {
+        'list[float]': ('echo_list', ListVector, vector.tolist()),
+        'NDArray[float64]': ('echo_packed', PackedVector, vector),
+        'NDArray': ('echo_envelope', EnvelopeVector, vector),
+    }
+    print(f'{SIZE:,} float64 values, best of {REPEAT}')
+    print(f'{"field":<18}{"size, bytes":>14}{"validate, ms":>14}{"encode, ms":>12}{"decode, ms":>12}')
+    for field, (method_name, model, values) in cases.items():
+        method: MethodGRPC = MethodGRPC(method=ArrayService.methods[method_name])
+        message: Message = model(values=values)
+        data: bytes = method.to_proto(message=message, model=model).SerializeToString()
+        proto_type: Type[ProtoMessage] = method.method.get_additional_proto(proto_name=model.__name__)
+        assert np.array_equal(method.to_pydantic(message=proto_type.FromString(data), model=model).values, vector)
+        print(
+            f'{field:<18}{len(data):>14,}'
+            f'{measure(func=lambda: model(values=values)):>14.2f}'
+            f'{measure(func=lambda: method.to_proto(message=message, model=model).SerializeToString()):>12.2f}'
+            f'{measure(func=lambda: method.to_pydantic(message=proto_type.FromString(data), model=model)):>12.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
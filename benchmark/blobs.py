@@ -0,0 +1,91 @@
+import tracemalloc
+from os import urandom
+from pathlib import Path
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from typing import Any, Type, Callable
+
+from pydantic import ConfigDict
+
+from google.protobuf.message import Message as ProtoMessage
+
+from py_grpcio import BaseService, Message, Blob, ServiceModes
+from py_grpcio.method import MethodGRPC
+
+BLOB_SIZE: int = 8 * 1024 * 1024
+REPEAT: int = 5
+
+
+class BytesImage(Message):
+    model_config = ConfigDict(ser_json_bytes='base64', val_json_bytes='base64')
+
+    id: int
+    data: bytes
+
+
+class BlobImage(Message):
+    id: int
+    data: Blob
+
+
+class DefaultImageService(BaseService):
+    async def echo_bytes(self, request: BytesImage) -> BytesImage:
+        return request
+
+    async def echo_blob(self, request: BlobImage) -> BlobImage:
+        return request
+
+
+class BytesImageService(BaseService, mode=ServiceModes.BYTES):
+    async def echo_bytes(self, request: BytesImage) -> BytesImage:
+        return request
+
+    async def echo_blob(self, request: BlobImage) -> BlobImage:
+        return request
+
+
+def hop(method: MethodGRPC, message: Message) -> Message:
+    proto: ProtoMessage = method.to_proto(message=message, model=message.__class__)
+    data: bytes = proto.SerializeToString()
+    received: ProtoMessage = proto.__class__.FromString(data)
+    return method.to_pydantic(message=received, model=message.__class__)
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, float]:
+    func()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline: int = tracemalloc.get_traced_memory()[0]
+    func()
+    peak: int = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    timings: list[float] = []
+    for _ in range(REPEAT):
+        started: float = perf_counter()
+        func()
+        timings.append(perf_counter() - started)
+    return peak / BLOB_SIZE, min(timings) * 1000
+
+
+def main() -> None:
+    with TemporaryDirectory() as proto_dir:
+        for service in (DefaultImageService, BytesImageService):
+            service.init_protos_and_services(proto_dir=Path(proto_dir), persisted=True)
+    data: bytes = urandom(BLOB_SIZE)
+    messages: dict[str, tuple[str, Message]] = {
+        'bytes': ('echo_bytes', BytesImage(id=1, data=data)),
+        'Blob': ('echo_blob', BlobImage(id=1, data=data)),
+    }
+    print(f'one hop (encode, serialize, parse, decode) of a {BLOB_SIZE // 1024 // 1024} MiB field')
+    print(f'{"mode":<10}{"field":<8}{"python allocations, x blob size":>34}{"time, ms":>12}')
+    service: Type[BaseService]
+    for service in (DefaultImageService, BytesImageService):
+        for field, (method_name, message) in messages.items():
+            method: MethodGRPC = MethodGRPC(method=service.methods[method_name])
+            assert hop(method=method, message=message).data == data
+            copies, elapsed = measure(func=lambda: hop(method=method, message=message))
+            print(f'{service.mode.value:<10}{field:<8}{copies:>34.1f}{elapsed:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
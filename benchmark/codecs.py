@@ -0,0 +1,51 @@
+from timeit import repeat
+from typing import Any, Callable
+
+from py_grpcio import BaseCodec, JsonCodec, OrjsonCodec, MsgpackCodec
+
+from example.bytes_server.service import BytesRequest
+
+NUMBER: int = 10_000
+REPEAT: int = 5
+
+
+def measure(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+def legacy_encode(message: BytesRequest) -> bytes:
+    return message.model_dump_json().encode()
+
+
+def legacy_decode(data: bytes) -> BytesRequest:
+    return BytesRequest.model_validate_json(json_data=data.decode())
+
+
+def main() -> None:
+    request: BytesRequest = BytesRequest(
+        data=[
+            {'a': 1, 'b': {1, 2, 3}, 'c': [1, 2, 3]},
+            {'x': 2, 'y': 3, 'z': 4},
+            {'name': 'py-grpcio', 'tags': ['pydantic', 'grpc'], 'nested': {'ratio': 0.5, 'enabled': True}}
+        ] * 10
+    )
+    print(f'{"codec":<16}{"size, bytes":>12}{"encode, us":>12}{"decode, us":>12}')
+    legacy: bytes = legacy_encode(message=request)
+    print(
+        f'{"legacy json":<16}{len(legacy):>12}'
+        f'{measure(func=lambda: legacy_encode(message=request)):>12.2f}'
+        f'{measure(func=lambda: legacy_decode(data=legacy)):>12.2f}'
+    )
+    codecs: list[BaseCodec] = [JsonCodec(), OrjsonCodec(), MsgpackCodec()]
+    for codec in codecs:
+        data: bytes = codec.encode(message=request)
+        assert codec.decode(data=data, model=BytesRequest) == request.model_validate_json(legacy)
+        print(
+            f'{codec.__class__.__name__:<16}{len(data):>12}'
+            f'{measure(func=lambda: codec.encode(message=request)):>12.2f}'
+            f'{measure(func=lambda: codec.decode(data=data, model=BytesRequest)):>12.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
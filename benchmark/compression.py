@@ -0,0 +1,71 @@
+from uuid import uuid4
+from pathlib import Path
+from timeit import repeat
+from tempfile import TemporaryDirectory
+from typing import Any, Callable
+from zlib import compressobj, decompress, MAX_WBITS
+
+from py_grpcio import JsonCodec, Compressions
+from py_grpcio.compression import DEFAULT_COMPRESSION_THRESHOLD
+
+from example.server.service import ExampleService, ComplexModel, ComplexRequest
+from example.server.service.enums import Names
+from example.bytes_server.service import BytesRequest
+
+NUMBER: int = 1_000
+REPEAT: int = 5
+
+# grpc core uses the zlib container for deflate and the gzip one for gzip, both at the default level
+WBITS: dict[Compressions, int] = {Compressions.DEFLATE: MAX_WBITS, Compressions.GZIP: MAX_WBITS | 16}
+
+
+def measure(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+def compress(data: bytes, compression: Compressions) -> bytes:
+    compressor = compressobj(wbits=WBITS[compression])
+    return compressor.compress(data) + compressor.flush()
+
+
+def payloads() -> dict[str, bytes]:
+    with TemporaryDirectory() as proto_dir:
+        ExampleService.init_protos_and_services(proto_dir=Path(proto_dir), persisted=True)
+    complex_request: ComplexRequest = ComplexRequest(id=uuid4(), model=ComplexModel(name=Names.NAME_1))
+    bytes_request: list[dict[str, Any]] = [
+        {'a': 1, 'b': [1, 2, 3], 'c': [1, 2, 3]},
+        {'x': 2, 'y': 3, 'z': 4},
+        {'name': 'py-grpcio', 'tags': ['pydantic', 'grpc'], 'nested': {'ratio': 0.5, 'enabled': True}}
+    ]
+    codec: JsonCodec = JsonCodec()
+    return {
+        'ComplexRequest': ExampleService.methods['complex'].get_converter(
+            message_name='ComplexRequest'
+        ).to_proto(complex_request).SerializeToString(),
+        'BytesRequest x10': codec.encode(message=BytesRequest(data=bytes_request * 10)),
+        'BytesRequest x1000': codec.encode(message=BytesRequest(data=bytes_request * 1000)),
+    }
+
+
+def main() -> None:
+    print(
+        f'{"payload":<20}{"algorithm":<10}{"size, bytes":>12}{"compressed":>12}{"saved":>8}'
+        f'{"compress, us":>14}{"decompress, us":>16}{"us per KiB saved":>18}'
+    )
+    for name, data in payloads().items():
+        for compression in Compressions:
+            compressed: bytes = compress(data=data, compression=compression)
+            assert decompress(compressed, wbits=WBITS[compression]) == data
+            compress_time: float = measure(func=lambda: compress(data=data, compression=compression))
+            decompress_time: float = measure(func=lambda: decompress(compressed, wbits=WBITS[compression]))
+            saved: int = len(data) - len(compressed)
+            cost: str = f'{(compress_time + decompress_time) / saved * 1024:.2f}' if saved > 0 else '-'
+            print(
+                f'{name:<20}{compression:<10}{len(data):>12}{len(compressed):>12}{saved / len(data):>8.0%}'
+                f'{compress_time:>14.2f}{decompress_time:>16.2f}{cost:>18}'
+            )
+    print(f'\nmessages below {DEFAULT_COMPRESSION_THRESHOLD} bytes are sent uncompressed by default')
+
+
+if __name__ == '__main__':
+    main()
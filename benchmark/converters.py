@@ -0,0 +1,79 @@
+from uuid import uuid4
+from pathlib import Path
+from timeit import repeat
+from tempfile import TemporaryDirectory
+from typing import Any, Type, Callable
+
+from google.protobuf.message import Message as ProtoMessage
+
+from py_grpcio.models import Method, Message
+from py_grpcio.proto import ProtoBufTypes
+
+from example.server.service import ExampleService, ComplexModel, ComplexRequest
+from example.server.service.enums import Names
+
+NUMBER: int = 10_000
+REPEAT: int = 5
+
+
+def legacy_proto_to_pydantic(message: ProtoMessage, model: Type[Message], method: Method) -> Message:
+    params: dict[str, Any] = {}
+    for descriptor, value in message.ListFields():
+        if isinstance(value, ProtoMessage):
+            value: Message = legacy_proto_to_pydantic(
+                message=value,
+                model=method.get_additional_message(message_name=descriptor.message_type.name),
+                method=method
+            )
+        params[descriptor.name]: Any = value
+    return model(**params)
+
+
+def legacy_pydantic_to_proto(message: Message, model: Type[ProtoMessage], method: Method) -> ProtoMessage:
+    exclude: set[str] = {field.name for field in message.fields() if field.type == ProtoBufTypes.BYTES}
+    dump: dict[str, Any] = message.model_dump(mode='json', warnings=False, exclude=exclude)
+    params: dict[str, Any] = {}
+    for field_name, field_info in message.__class__.model_fields.items():
+        if field_info.annotation.__name__ in method.additional_messages:
+            value: ProtoMessage = legacy_pydantic_to_proto(
+                message=getattr(message, field_name),
+                model=method.get_additional_proto(proto_name=field_info.annotation.__name__),
+                method=method
+            )
+        elif field_info.annotation is bytes:
+            value: bytes = getattr(message, field_name)
+        else:
+            value: Any = dump[field_name]
+        params[field_name] = value
+    return model(**params)  # noqa: args, kwargs
+
+
+def measure(func: Callable[[], Any]) -> float:
+    return min(repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    with TemporaryDirectory() as proto_dir:
+        ExampleService.init_protos_and_services(proto_dir=Path(proto_dir), persisted=True)
+    method: Method = ExampleService.methods['complex']
+    request: ComplexRequest = ComplexRequest(id=uuid4(), model=ComplexModel(name=Names.NAME_1))
+    proto_request: ProtoMessage = method.get_converter(message_name='ComplexRequest').to_proto(request)
+
+    results: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        'pydantic_to_proto': (
+            lambda: legacy_pydantic_to_proto(message=request, model=method.proto_request, method=method),
+            lambda: method.get_converter(message_name='ComplexRequest').to_proto(request)
+        ),
+        'proto_to_pydantic': (
+            lambda: legacy_proto_to_pydantic(message=proto_request, model=ComplexRequest, method=method),
+            lambda: method.get_converter(message_name='ComplexRequest').to_pydantic(proto_request)
+        ),
+    }
+    print(f'{"conversion":<20}{"legacy, us":>12}{"compiled, us":>14}{"speedup":>10}')
+    for name, (legacy, compiled) in results.items():
+        legacy_time, compiled_time = measure(func=legacy), measure(func=compiled)
+        print(f'{name:<20}{legacy_time:>12.2f}{compiled_time:>14.2f}{legacy_time / compiled_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
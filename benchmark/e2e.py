@@ -0,0 +1,283 @@
+import json
+import platform
+from uuid import UUID, uuid4
+from pathlib import Path
+from socket import socket
+from datetime import datetime
+from argparse import ArgumentParser, Namespace
+from tempfile import TemporaryDirectory
+from multiprocessing import get_context
+from multiprocessing.context import SpawnProcess
+from concurrent.futures import ThreadPoolExecutor
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Type
+from asyncio import run, gather, sleep, get_running_loop
+
+from grpc import __version__ as grpc_version
+
+from py_grpcio import (
+    BaseServer, BaseService, BaseMiddleware, Message, ServiceModes, EventLoops, AccessLog,
+    __version__ as py_grpcio_version
+)
+from py_grpcio.loop import get_loop_factory
+
+from example.server.service import PingRequest, PingResponse, ComplexModel
+from example.server.service.enums import Names
+
+
+class LargeMessage(Message):
+    id: UUID
+    model: ComplexModel
+    values: list[int]
+    names: list[str]
+    attributes: dict[str, str]
+    records: list[ComplexModel]
+
+
+class DefaultBenchmarkService(BaseService):
+    async def ping(self, request: PingRequest) -> PingResponse:
+        return PingResponse(id=request.id)
+
+    async def large(self, request: LargeMessage) -> LargeMessage:
+        return request
+
+
+class BytesBenchmarkService(BaseService, mode=ServiceModes.BYTES):
+    async def ping(self, request: PingRequest) -> PingResponse:
+        return PingResponse(id=request.id)
+
+    async def large(self, request: LargeMessage) -> LargeMessage:
+        return request
+
+
+class FirstMiddleware(BaseMiddleware):
+    async def __call__(self, request: Message, context: Any) -> Message:
+        return await self.call_target(request=request, context=context)
+
+
+class SecondMiddleware(BaseMiddleware):
+    async def __call__(self, request: Message, context: Any) -> Message:
+        return await self.call_target(request=request, context=context)
+
+
+SERVICES: dict[ServiceModes, Type[BaseService]] = {
+    ServiceModes.DEFAULT: DefaultBenchmarkService,
+    ServiceModes.BYTES: BytesBenchmarkService,
+}
+
+PAYLOADS: dict[str, Message] = {
+    'small': PingRequest(),
+    'large': LargeMessage(
+        id=uuid4(),
+        model=ComplexModel(name=Names.NAME_1),
+        values=list(range(10_000)),
+        names=[f'name-{index}' for index in range(1_000)],
+        attributes={f'key-{index}': f'value-{index}' for index in range(100)},
+        records=[ComplexModel(name=name) for name in Names] * 100
+    ),
+}
+
+METHODS: dict[str, str] = {'small': 'ping', 'large': 'large'}
+
+
+def free_port() -> int:
+    with socket() as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+
+def run_server(port: int, middlewares: bool, event_loop: EventLoops) -> None:
+    with TemporaryDirectory() as proto_dir:
+        server: BaseServer = BaseServer(
+            port=port,
+            proto_dir=Path(proto_dir),
+            persisted_protos=True,
+            middlewares={FirstMiddleware, SecondMiddleware} if middlewares else None,
+            access_log=AccessLog(enabled=False),
+            event_loop=event_loop
+        )
+        for service in SERVICES.values():
+            server.add_service(service=service)
+        server.run()
+
+
+async def wait_ready(service: BaseService, timeout: float = 30) -> None:
+    deadline: float = perf_counter() + timeout
+    while True:
+        try:
+            await service.ping(request=PingRequest())
+            return
+        except Exception:
+            if perf_counter() > deadline:
+                raise
+            await sleep(0.1)
+
+
+async def collect(service: BaseService, payload: str, requests: int, concurrency: int) -> tuple[list[float], float]:
+    call: Any = getattr(service, METHODS[payload])
+    request: Message = PAYLOADS[payload]
+    latencies: list[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            started: float = perf_counter()
+            await call(request=request)
+            latencies.append(perf_counter() - started)
+
+    await gather(*(worker(count=max(requests // concurrency // 10, 1)) for _ in range(concurrency)))
+    latencies.clear()
+    started: float = perf_counter()
+    await gather(*(worker(count=requests // concurrency) for _ in range(concurrency)))
+    return latencies, perf_counter() - started
+
+
+def collect_in_thread(
+    service: BaseService,
+    payload: str,
+    requests: int,
+    concurrency: int,
+    event_loop: EventLoops
+) -> tuple[list[float], float]:
+    return run(
+        collect(service=service, payload=payload, requests=requests, concurrency=concurrency),
+        loop_factory=get_loop_factory(event_loop=event_loop)
+    )
+
+
+async def measure(service: BaseService, payload: str, arguments: Namespace, event_loop: EventLoops) -> dict[str, Any]:
+    if arguments.threads == 1:
+        latencies, elapsed = await collect(
+            service=service,
+            payload=payload,
+            requests=arguments.requests,
+            concurrency=arguments.concurrency
+        )
+    else:
+        # every thread drives the same client from its own event loop
+        with ThreadPoolExecutor(max_workers=arguments.threads) as executor:
+            parts: list[tuple[list[float], float]] = await gather(*(
+                get_running_loop().run_in_executor(
+                    executor,
+                    collect_in_thread,
+                    service,
+                    payload,
+                    arguments.requests // arguments.threads,
+                    max(arguments.concurrency // arguments.threads, 1),
+                    event_loop
+                )
+                for _ in range(arguments.threads)
+            ))
+        latencies: list[float] = [latency for part, _ in parts for latency in part]
+        elapsed: float = max(part_elapsed for _, part_elapsed in parts)
+    percentiles: list[float] = quantiles(latencies, n=100)
+    return {
+        'requests': len(latencies),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentiles[49] * 1000, 3),
+        'p90_ms': round(percentiles[89] * 1000, 3),
+        'p99_ms': round(percentiles[98] * 1000, 3),
+        'max_ms': round(max(latencies) * 1000, 3),
+    }
+
+
+async def run_client(
+    port: int,
+    middlewares: bool,
+    event_loop: EventLoops,
+    arguments: Namespace
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    with TemporaryDirectory() as proto_dir:
+        for mode, service_type in SERVICES.items():
+            async with service_type(
+                port=port,
+                proto_dir=Path(proto_dir),
+                persisted_protos=True,
+                timeout_delay=30,
+                channels=arguments.channels
+            ) as service:
+                await wait_ready(service=service)
+                for payload in PAYLOADS:
+                    result: dict[str, Any] = await measure(
+                        service=service,
+                        payload=payload,
+                        arguments=arguments,
+                        event_loop=event_loop
+                    )
+                    results.append({
+                        'loop': event_loop.value,
+                        'mode': mode.value,
+                        'payload': payload,
+                        'middlewares': middlewares,
+                        **result
+                    })
+                    print(
+                        f'{event_loop.value:<9}{mode.value:<10}{payload:<8}{str(middlewares):<13}{result["rps"]:>10.1f}'
+                        f'{result["p50_ms"]:>10.3f}{result["p90_ms"]:>10.3f}{result["p99_ms"]:>10.3f}'
+                    )
+    return results
+
+
+def parse_arguments() -> Namespace:
+    parser: ArgumentParser = ArgumentParser(description='End-to-end py-grpcio server and client benchmark')
+    parser.add_argument('--requests', type=int, default=5_000, help='requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=50, help='concurrent client coroutines')
+    parser.add_argument('--channels', type=int, default=1, help='client channel pool size')
+    parser.add_argument(
+        '--loops',
+        type=EventLoops,
+        nargs='+',
+        default=[EventLoops.ASYNCIO, EventLoops.UVLOOP],
+        help='event loops of the server and the client'
+    )
+    parser.add_argument('--threads', type=int, default=1, help='client threads, each with its own event loop')
+    parser.add_argument('--output', type=Path, default=Path('benchmark-e2e.json'), help='JSON results file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments: Namespace = parse_arguments()
+    results: list[dict[str, Any]] = []
+    print(
+        f'{"loop":<9}{"mode":<10}{"payload":<8}{"middlewares":<13}'
+        f'{"rps":>10}{"p50, ms":>10}{"p90, ms":>10}{"p99, ms":>10}'
+    )
+    for event_loop in arguments.loops:
+        for middlewares in (False, True):
+            port: int = free_port()
+            server: SpawnProcess = get_context('spawn').Process(
+                target=run_server,
+                args=(port, middlewares, event_loop)
+            )
+            server.start()
+            try:
+                results.extend(run(
+                    run_client(port=port, middlewares=middlewares, event_loop=event_loop, arguments=arguments),
+                    loop_factory=get_loop_factory(event_loop=event_loop)
+                ))
+            finally:
+                server.terminate()
+                server.join()
+    arguments.output.write_text(data=json.dumps(
+        {
+            'meta': {
+                'py_grpcio': py_grpcio_version,
+                'grpcio': grpc_version,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timestamp': datetime.now().isoformat(),
+                'requests': arguments.requests,
+                'concurrency': arguments.concurrency,
+                'channels': arguments.channels,
+                'threads': arguments.threads,
+            },
+            'results': results,
+        },
+        indent=2
+    ))
+    print(f'Results are written to {arguments.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,15 +6,15 @@ from example.bytes_client.services.bytes import BytesService, BytesRequest, Byte
 
 
 async def test() -> None:
-    service: BytesService = BytesService()
-    response: BytesResponse = await service.test(
-        request=BytesRequest(
-            data=[
-                {'a': 1, 'b': {1, 2, 3}, 'c': [1, 2, 3]},
-                {'x': 2, 'y': 3, 'z': 4}
-            ]
+    async with BytesService() as service:
+        response: BytesResponse = await service.test(
+            request=BytesRequest(
+                data=[
+                    {'a': 1, 'b': {1, 2, 3}, 'c': [1, 2, 3]},
+                    {'x': 2, 'y': 3, 'z': 4}
+                ]
+            )
         )
-    )
     logger.info(response)
 
 
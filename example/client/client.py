@@ -1,5 +1,6 @@
 from uuid import uuid4
 from asyncio import run
+from collections.abc import AsyncIterator
 
 from loguru import logger
 
@@ -12,6 +13,11 @@ from example.client.services.example import (
 service: ExampleService = ExampleService(host='127.0.0.1')
 
 
+async def pings(count: int) -> AsyncIterator[PingRequest]:
+    for _ in range(count):
+        yield PingRequest()
+
+
 async def main() -> None:
     response: PingResponse = await service.ping(request=PingRequest())
     logger.info(f'ping response: {response}')
@@ -21,6 +27,11 @@ async def main() -> None:
     )
     logger.info(f'complex response: {response}')
 
+    async for response in service.stream(request=pings(count=3)):
+        logger.info(f'stream response: {response}')
+
+    await service.close()
+
 
 if __name__ == '__main__':
     run(main())
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from py_grpcio import BaseService
 
@@ -13,3 +14,7 @@ class BaseExampleService(BaseService, ABC):
     @abstractmethod
     async def complex(self, request: ComplexRequest) -> ComplexResponse:
         ...
+
+    @abstractmethod
+    async def stream(self, request: AsyncIterator[PingRequest]) -> AsyncIterator[PingResponse]:
+        ...
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+
 from example.server.service.base import BaseExampleService
 from example.server.service.models import PingRequest, PingResponse, ComplexRequest, ComplexResponse
 
@@ -8,3 +10,7 @@ class ExampleService(BaseExampleService):
 
     async def complex(self, request: ComplexRequest) -> ComplexResponse:
         return ComplexResponse(**request.model_dump())
+
+    async def stream(self, request: AsyncIterator[PingRequest]) -> AsyncIterator[PingResponse]:
+        async for ping in request:
+            yield PingResponse(id=ping.id)
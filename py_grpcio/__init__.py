@@ -1,16 +1,40 @@
 from py_grpcio.models import Message
+from py_grpcio.blob import Blob
+from py_grpcio.ndarray import NDArray
 from py_grpcio.server import BaseServer
-from py_grpcio.enums import ServiceModes
+from py_grpcio.enums import ServiceModes, Executors, Stages, Compressions, Presets, EventLoops
+from py_grpcio.options import ServerOptions, ChannelOptions
+from py_grpcio.proto import ProtoBufTypes
+from py_grpcio.decorators import (
+    executor, concurrency_limit, timeout, chunked, batched, batch_handler, single_flight, cached, hedged, compressed
+)
+from py_grpcio.limiter import ConcurrencyLimiter
+from py_grpcio.metrics import BaseMetricsExporter, InMemoryExporter, PrometheusExporter
+from py_grpcio.access_log import AccessLog
+from py_grpcio.cache import ResponseCache
+from py_grpcio.exceptions import BatchItemError
 from py_grpcio.service import BaseService
 from py_grpcio.middleware import BaseMiddleware
+from py_grpcio.codec import BaseCodec, JsonCodec, OrjsonCodec, MsgpackCodec
 
 from py_grpcio.__meta__ import __version__, __module_path__
 
 __all__: list[str] = [
-    'BaseServer',
+    'BaseServer', 'EventLoops',
     'BaseService', 'ServiceModes',
+    'Executors', 'executor', 'Stages',
+    'ConcurrencyLimiter', 'concurrency_limit',
+    'timeout',
+    'chunked',
+    'batched', 'batch_handler', 'BatchItemError',
+    'single_flight', 'hedged',
+    'Compressions', 'compressed',
+    'ServerOptions', 'ChannelOptions', 'Presets',
+    'ResponseCache', 'cached',
+    'BaseMetricsExporter', 'InMemoryExporter', 'PrometheusExporter', 'AccessLog',
+    'BaseCodec', 'JsonCodec', 'OrjsonCodec', 'MsgpackCodec',
     'BaseMiddleware',
-    'Message',
+    'Message', 'Blob', 'NDArray', 'ProtoBufTypes',
     '__version__',
     '__module_path__'
 ]
@@ -0,0 +1,93 @@
+from random import random
+from threading import Thread
+from typing import NamedTuple
+from queue import Queue, Full
+
+from loguru import logger
+
+from grpc import StatusCode
+from grpc.aio import ServicerContext
+
+from py_grpcio.utils import block_signals
+
+
+class AccessRecord(NamedTuple):
+    method: str
+    peer: str
+    code: StatusCode
+    duration: float
+    details: str | None = None
+
+
+class AccessLog:
+    def __init__(
+        self: 'AccessLog',
+        sample_rate: float = 1.0,
+        method_rates: dict[str, float] | None = None,
+        status_rates: dict[StatusCode, float] | None = None,
+        queue_size: int = 10000,
+        enabled: bool = True
+    ):
+        self.sample_rate: float = sample_rate
+        self.method_rates: dict[str, float] = method_rates or {}
+        self.status_rates: dict[StatusCode, float] = status_rates or {}
+        self.enabled: bool = enabled
+
+        self.queue: Queue[AccessRecord | None] = Queue(maxsize=queue_size)
+        self.writer: Thread | None = None
+        self.dropped: int = 0
+
+    def get_rate(self: 'AccessLog', method: str, code: StatusCode) -> float:
+        if (rate := self.status_rates.get(code)) is not None:
+            return rate
+        return self.method_rates.get(method, self.sample_rate)
+
+    def record(
+        self: 'AccessLog',
+        method: str,
+        code: StatusCode,
+        duration: float,
+        context: ServicerContext,
+        details: str | None = None
+    ) -> None:
+        if not self.enabled:
+            return
+        if (rate := self.get_rate(method=method, code=code)) < 1 and random() >= rate:
+            return
+        if self.writer is None:
+            self.start()
+        try:
+            self.queue.put_nowait(AccessRecord(method, context.peer(), code, duration, details))
+        except Full:
+            self.dropped += 1
+
+    @classmethod
+    def write(cls, record: AccessRecord) -> None:
+        bound = logger.bind(
+            method=record.method,
+            peer=record.peer,
+            code=record.code.name,
+            duration_ms=round(record.duration * 1000, 3)
+        )
+        message: str = f'{record.peer} - {record.method} | {record.code.name} | {record.duration * 1000:.2f}ms'
+        if record.code is StatusCode.OK:
+            bound.info(message)
+        else:
+            bound.error(f'{message} | {record.details}' if record.details else message)
+
+    def run(self: 'AccessLog') -> None:
+        block_signals()
+        while (record := self.queue.get()) is not None:
+            self.write(record=record)
+
+    def start(self: 'AccessLog') -> None:
+        if self.enabled and self.writer is None:
+            self.writer: Thread = Thread(target=self.run, name='py-grpcio-access-log', daemon=True)
+            self.writer.start()
+
+    def close(self: 'AccessLog') -> None:
+        if self.writer is None:
+            return
+        writer, self.writer = self.writer, None
+        self.queue.put(None)
+        writer.join()
@@ -0,0 +1,192 @@
+from math import exp
+from random import sample
+from time import perf_counter, monotonic
+from types import ModuleType
+from typing import TypeVar
+from collections import deque
+from collections.abc import Awaitable, Callable
+from asyncio import Task, FIRST_COMPLETED, ensure_future, wait
+
+from grpc import StatusCode, Compression
+from grpc.aio import AioRpcError
+
+from google.protobuf.message import Message as ProtoMessage
+
+from py_grpcio.channel import ChannelPool, MultiCallable
+from py_grpcio.options import ChannelOptions
+
+type Delay = float
+
+T = TypeVar('T')
+
+EWMA_ALPHA: float = 0.3
+EWMA_DECAY: Delay = 5.0
+EWMA_BASELINE: Delay = 0.001
+UNAVAILABLE_PENALTY: Delay = 1.0
+LATENCY_WINDOW: int = 1000
+LATENCY_MIN_SAMPLES: int = 20
+LATENCY_REFRESH: int = 50
+
+
+class Endpoint:
+    def __init__(self: 'Endpoint', pool: ChannelPool):
+        self.pool: ChannelPool = pool
+        self.ewma: Delay = 0.0
+        self.updated: float = monotonic()
+        self.outstanding: int = 0
+
+    def cost(self: 'Endpoint', baseline: Delay) -> float:
+        if not self.ewma:
+            return baseline * (self.outstanding + 1)
+        if self.outstanding:
+            return self.ewma * (self.outstanding + 1)
+        # an idle endpoint slowly loses its latency history, so slow or failed replicas get probed again
+        return self.ewma * exp((self.updated - monotonic()) / EWMA_DECAY)
+
+    def observe(self: 'Endpoint', latency: Delay) -> None:
+        self.ewma += EWMA_ALPHA * (latency - self.ewma) if self.ewma else latency
+        self.updated = monotonic()
+
+    def penalize(self: 'Endpoint') -> None:
+        self.ewma = max(self.ewma, UNAVAILABLE_PENALTY)
+        self.updated = monotonic()
+
+
+class LoadBalancer:
+    def __init__(
+        self: 'LoadBalancer',
+        targets: list[str],
+        services: ModuleType,
+        service_name: str,
+        size: int = 1,
+        channel_options: ChannelOptions | None = None
+    ):
+        if not targets:
+            raise ValueError('Load balancer needs at least one endpoint')
+        self.endpoints: list[Endpoint] = [
+            Endpoint(pool=ChannelPool(
+                target=target,
+                services=services,
+                service_name=service_name,
+                size=size,
+                channel_options=channel_options
+            ))
+            for target in targets
+        ]
+
+    def baseline(self: 'LoadBalancer') -> Delay:
+        # endpoints without latency history are priced at the pool mean, so their in-flight calls still count
+        observed: list[Delay] = [endpoint.ewma for endpoint in self.endpoints if endpoint.ewma]
+        return sum(observed) / len(observed) if observed else EWMA_BASELINE
+
+    def pick(self: 'LoadBalancer') -> Endpoint:
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+        first, second = sample(self.endpoints, 2)
+        baseline: Delay = self.baseline()
+        return first if first.cost(baseline=baseline) <= second.cost(baseline=baseline) else second
+
+    def get_method(self: 'LoadBalancer', rpc_name: str) -> MultiCallable:
+        return self.pick().pool.get_method(rpc_name=rpc_name)
+
+    async def unary(
+        self: 'LoadBalancer',
+        rpc_name: str,
+        request: ProtoMessage,
+        timeout: Delay | None = None,
+        compression: Compression | None = None
+    ) -> ProtoMessage:
+        endpoint: Endpoint = self.pick()
+        endpoint.outstanding += 1
+        started: float = perf_counter()
+        try:
+            response: ProtoMessage = await endpoint.pool.get_method(rpc_name=rpc_name)(
+                request,
+                timeout=timeout,
+                compression=compression
+            )
+        except AioRpcError as exc:
+            if exc.code() is StatusCode.UNAVAILABLE:
+                endpoint.penalize()
+            else:
+                endpoint.observe(latency=perf_counter() - started)
+            raise
+        finally:
+            endpoint.outstanding -= 1
+        endpoint.observe(latency=perf_counter() - started)
+        return response
+
+    async def close(self: 'LoadBalancer', grace: float | None = None) -> None:
+        for endpoint in self.endpoints:
+            await endpoint.pool.close(grace=grace)
+
+
+class HedgePolicy:
+    def __init__(
+        self: 'HedgePolicy',
+        delay: Delay | None = None,
+        percentile: float = 95.0,
+        window: int = LATENCY_WINDOW
+    ):
+        self.delay: Delay | None = delay
+        self.percentile: float = percentile
+        self.samples: deque[Delay] = deque(maxlen=window)
+        self.updates: int = 0
+        self.estimate: Delay | None = None
+
+        self.calls: int = 0
+        self.hedged: int = 0
+
+    @property
+    def stats(self: 'HedgePolicy') -> dict[str, float]:
+        return {
+            'calls': self.calls,
+            'hedged': self.hedged,
+            'hedge_ratio': self.hedged / self.calls if self.calls else 0.0,
+            'delay': self.get_delay() or 0.0,
+        }
+
+    def observe(self: 'HedgePolicy', latency: Delay) -> None:
+        self.samples.append(latency)
+        self.updates += 1
+
+    def get_delay(self: 'HedgePolicy') -> Delay | None:
+        if self.delay is not None:
+            return self.delay
+        if len(self.samples) < LATENCY_MIN_SAMPLES:
+            return None
+        if self.estimate is None or self.updates >= LATENCY_REFRESH:
+            samples: list[Delay] = sorted(self.samples)
+            self.estimate = samples[round(self.percentile / 100 * (len(samples) - 1))]
+            self.updates = 0
+        return self.estimate
+
+    async def call(self: 'HedgePolicy', attempt: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        started: float = perf_counter()
+        if (delay := self.get_delay()) is None:
+            response: T = await attempt()
+        else:
+            response, hedged = await hedge(attempt=attempt, delay=delay)
+            self.hedged += hedged
+        self.observe(latency=perf_counter() - started)
+        return response
+
+
+async def hedge(attempt: Callable[[], Awaitable[T]], delay: Delay) -> tuple[T, bool]:
+    tasks: set[Task] = {ensure_future(attempt())}
+    try:
+        done, _ = await wait(tasks, timeout=delay)
+        hedged: bool = not done
+        if hedged:
+            tasks.add(ensure_future(attempt()))
+        error: BaseException | None = None
+        while tasks:
+            done, tasks = await wait(tasks, return_when=FIRST_COMPLETED)
+            for task in done:
+                if (error := task.exception()) is None:
+                    return task.result(), hedged
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,122 @@
+from typing import Any
+from contextvars import ContextVar
+from collections.abc import Awaitable, Callable
+from asyncio import AbstractEventLoop, Future, Task, TimerHandle, CancelledError, get_running_loop
+
+from py_grpcio.exceptions import RunTimeServerError
+
+type BatchResult = Any | Exception
+type SendBatch = Callable[[list[Any]], Awaitable[list[BatchResult]]]
+
+
+class RequestBatcher:
+    def __init__(self: 'RequestBatcher', send: SendBatch, max_size: int, max_delay: float):
+        self.send: SendBatch = send
+        self.max_size: int = max_size
+        self.max_delay: float = max_delay
+
+        # futures and timers belong to one event loop, so every loop collects its own batch
+        self.pending: dict[AbstractEventLoop, list[tuple[Any, Future]]] = {}
+        self.timers: dict[AbstractEventLoop, TimerHandle] = {}
+        self.tasks: set[Task] = set()
+
+        self.calls: int = 0
+        self.batches: int = 0
+
+    @property
+    def stats(self: 'RequestBatcher') -> dict[str, float]:
+        return {
+            'calls': self.calls,
+            'batches': self.batches,
+            'average_size': self.calls / self.batches if self.batches else 0.0,
+        }
+
+    async def submit(self: 'RequestBatcher', request: Any) -> Any:
+        loop: AbstractEventLoop = get_running_loop()
+        future: Future = loop.create_future()
+        pending: list[tuple[Any, Future]] = self.pending.setdefault(loop, [])
+        pending.append((request, future))
+        if len(pending) >= self.max_size:
+            self.flush(loop=loop)
+        elif loop not in self.timers:
+            self.timers[loop] = loop.call_later(self.max_delay, self.flush, loop)
+        return await future
+
+    def flush(self: 'RequestBatcher', loop: AbstractEventLoop) -> None:
+        if (timer := self.timers.pop(loop, None)) is not None:
+            timer.cancel()
+        batch: list[tuple[Any, Future]] = [item for item in self.pending.pop(loop, []) if not item[1].done()]
+        if not batch:
+            return
+        self.calls += len(batch)
+        self.batches += 1
+        task: Task = loop.create_task(self.send_batch(batch=batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def send_batch(self: 'RequestBatcher', batch: list[tuple[Any, Future]]) -> None:
+        try:
+            results: list[BatchResult] = await self.send([request for request, _ in batch])
+        except CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            results: list[BatchResult] = [exc] * len(batch)
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            result: BatchResult = results[index] if index < len(results) else RunTimeServerError(
+                details=f'Batch response has no result for request {index}'
+            )
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class PendingBatch:
+    def __init__(self: 'PendingBatch', size: int):
+        self.requests: list[Any] = []
+        self.futures: list[Future] = []
+        self.left: int = size
+        self.ready: Future = get_running_loop().create_future()
+
+    def settle(self: 'PendingBatch') -> None:
+        self.left -= 1
+        if not self.left:
+            self.ready.set_result(None)
+
+    def join(self: 'PendingBatch', request: Any) -> Future:
+        future: Future = get_running_loop().create_future()
+        self.requests.append(request)
+        self.futures.append(future)
+        self.settle()
+        return future
+
+    def resolve(self: 'PendingBatch', results: list[Any] | Exception) -> None:
+        for index, future in enumerate(self.futures):
+            if future.done():
+                continue
+            if isinstance(results, Exception):
+                future.set_exception(results)
+            else:
+                future.set_result(results[index])
+
+
+class BatchSlot:
+    def __init__(self: 'BatchSlot', batch: PendingBatch):
+        self.batch: PendingBatch = batch
+        self.joined: bool = False
+
+    def join(self: 'BatchSlot', request: Any) -> Future:
+        self.joined = True
+        return self.batch.join(request=request)
+
+    def leave(self: 'BatchSlot') -> None:
+        # an item rejected by a middleware never joins, the batch must not wait for it
+        if not self.joined:
+            self.batch.settle()
+
+
+batch_slot: ContextVar[BatchSlot | None] = ContextVar('batch_slot', default=None)
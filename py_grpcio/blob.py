@@ -0,0 +1,39 @@
+from functools import cache
+from typing import Any, Annotated, Type
+
+from pydantic import BaseModel, Field
+from pydantic.fields import FieldInfo  # noqa: FieldInfo
+from pydantic_core.core_schema import CoreSchema, no_info_plain_validator_function, plain_serializer_function_ser_schema
+
+BLOB_TYPES: tuple[type, ...] = (bytes, bytearray, memoryview)
+
+
+class BlobAnnotation:
+    @classmethod
+    def validate(cls: Type['BlobAnnotation'], value: Any) -> bytes | bytearray | memoryview:
+        if isinstance(value, BLOB_TYPES):
+            return value
+        raise ValueError(f'Blob must be bytes, bytearray or memoryview, not {value.__class__.__name__}')
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls: Type['BlobAnnotation'], source_type: Any, _) -> CoreSchema:
+        return no_info_plain_validator_function(
+            cls.validate,
+            serialization=plain_serializer_function_ser_schema(lambda value: value)
+        )
+
+
+Blob = Annotated[bytes, BlobAnnotation, Field(exclude=True)]
+
+
+def is_blob(field_info: FieldInfo) -> bool:
+    return BlobAnnotation in field_info.metadata
+
+
+@cache
+def get_blob_fields(model: Type[BaseModel]) -> tuple[str, ...]:
+    return tuple(field_name for field_name, field_info in model.model_fields.items() if is_blob(field_info=field_info))
+
+
+def blob_bytes(value: bytes | bytearray | memoryview) -> bytes:
+    return value if value.__class__ is bytes else bytes(value)
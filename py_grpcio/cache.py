@@ -0,0 +1,84 @@
+from time import monotonic
+from typing import Any, NamedTuple
+from contextvars import ContextVar
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES: int = 1024
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    size: int
+    expires: float
+
+
+# published by the server method for the cache middleware, which runs behind the other middlewares
+cache_request_key: ContextVar[bytes | None] = ContextVar('cache_request_key', default=None)
+
+
+class ResponseCache:
+    def __init__(
+        self: 'ResponseCache',
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        encoded: bool = True
+    ):
+        if max_entries < 1:
+            raise ValueError(f'Cache size must be positive, not {max_entries}')
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.encoded: bool = encoded
+
+        self.entries: OrderedDict[bytes, CacheEntry] = OrderedDict()
+        self.bytes: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    @property
+    def stats(self: 'ResponseCache') -> dict[str, float]:
+        lookups: int = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+    def pop(self: 'ResponseCache', key: bytes) -> None:
+        if (entry := self.entries.pop(key, None)) is not None:
+            self.bytes -= entry.size
+
+    def get(self: 'ResponseCache', key: bytes) -> Any | None:
+        if (entry := self.entries.get(key)) is None:
+            self.misses += 1
+            return None
+        if entry.expires <= monotonic():
+            self.pop(key=key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self: 'ResponseCache', key: bytes, value: Any, size: int, ttl: float) -> None:
+        self.pop(key=key)
+        if size > self.max_bytes or ttl <= 0:
+            return
+        self.entries[key] = CacheEntry(value=value, size=size, expires=monotonic() + ttl)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, entry = self.entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+
+    def clear(self: 'ResponseCache') -> None:
+        self.entries.clear()
+        self.bytes = 0
@@ -0,0 +1,110 @@
+from types import ModuleType
+from typing import Any
+from threading import Lock
+from asyncio import AbstractEventLoop, Task, get_running_loop, run_coroutine_threadsafe, wrap_future
+
+from grpc import Compression
+from grpc.aio import Channel, insecure_channel
+
+from google.protobuf.message import Message as ProtoMessage
+
+from py_grpcio.options import ChannelOptions, ChannelOption
+
+type Stub = Any
+type MultiCallable = Any
+
+
+class Channels:
+    def __init__(self: 'Channels', channels: list[Channel], stubs: list[Stub]):
+        self.channels: list[Channel] = channels
+        self.stubs: list[Stub] = stubs
+        self.methods: list[dict[str, MultiCallable]] = [vars(stub) for stub in self.stubs]
+        self.index: int = 0
+
+    def next(self: 'Channels') -> int:
+        if len(self.channels) == 1:
+            return 0
+        self.index = (self.index + 1) % len(self.channels)
+        return self.index
+
+    async def close(self: 'Channels', grace: float | None = None) -> None:
+        for channel in self.channels:
+            await channel.close(grace=grace)
+
+
+class ChannelPool:
+    def __init__(
+        self: 'ChannelPool',
+        target: str,
+        services: ModuleType,
+        service_name: str,
+        size: int = 1,
+        channel_options: ChannelOptions | None = None
+    ):
+        if size < 1:
+            raise ValueError(f'Channel pool size must be positive, not {size}')
+        self.target: str = target
+        self.services: ModuleType = services
+        self.service_name: str = service_name
+        self.size: int = size
+        self.channel_options: ChannelOptions = channel_options if channel_options is not None else ChannelOptions()
+
+        # aio channels are bound to the loop that created them, so every loop (or thread) gets its own
+        self.loops: dict[AbstractEventLoop, Channels] = {}
+        self.lock: Lock = Lock()
+        self.tasks: set[Task] = set()
+
+    @property
+    def options(self: 'ChannelPool') -> list[ChannelOption]:
+        options: list[ChannelOption] = self.channel_options.to_grpc()
+        if self.size > 1:
+            # identical channels share one subchannel (one connection) unless every channel owns its pool
+            options.append(('grpc.use_local_subchannel_pool', 1))
+        return options
+
+    def open(self: 'ChannelPool') -> Channels:
+        stub_type: type = getattr(self.services, f'{self.service_name}Stub')
+        channels: list[Channel] = [insecure_channel(target=self.target, options=self.options) for _ in range(self.size)]
+        return Channels(channels=channels, stubs=[stub_type(channel) for channel in channels])
+
+    def get_channels(self: 'ChannelPool') -> Channels:
+        loop: AbstractEventLoop = get_running_loop()
+        if (channels := self.loops.get(loop)) is not None:
+            return channels
+        with self.lock:
+            if (channels := self.loops.get(loop)) is None:
+                channels: Channels = self.open()
+                loops: dict[AbstractEventLoop, Channels] = {loop: channels}
+                for other, other_channels in self.loops.items():
+                    if not other.is_closed():
+                        loops[other] = other_channels
+                        continue
+                    # channels of a finished loop can not be used anymore, so the current loop closes them
+                    task: Task = loop.create_task(other_channels.close())
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+                self.loops = loops
+        return channels
+
+    def get_method(self: 'ChannelPool', rpc_name: str) -> MultiCallable:
+        channels: Channels = self.get_channels()
+        return channels.methods[channels.next()][rpc_name]
+
+    async def unary(
+        self: 'ChannelPool',
+        rpc_name: str,
+        request: ProtoMessage,
+        timeout: float | None = None,
+        compression: Compression | None = None
+    ) -> ProtoMessage:
+        return await self.get_method(rpc_name=rpc_name)(request, timeout=timeout, compression=compression)
+
+    async def close(self: 'ChannelPool', grace: float | None = None) -> None:
+        with self.lock:
+            loops, self.loops = self.loops, {}
+        current: AbstractEventLoop = get_running_loop()
+        for loop, channels in loops.items():
+            if loop is current or loop.is_closed():
+                await channels.close(grace=grace)
+            elif loop.is_running():
+                await wrap_future(run_coroutine_threadsafe(channels.close(grace=grace), loop))
@@ -0,0 +1,42 @@
+from collections.abc import AsyncIterable, Iterator
+from typing import Type
+
+from grpc_interceptor.exceptions import ResourceExhausted, DataLoss
+
+from google.protobuf.message import Message as ProtoMessage
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+DEFAULT_MAX_PAYLOAD_SIZE: int = 64 * 1024 * 1024
+
+
+def payload_too_large(size: int, max_size: int) -> ResourceExhausted:
+    return ResourceExhausted(details=f'Chunked payload of {size} bytes exceeds the limit of {max_size} bytes')
+
+
+def payload_size_mismatch(size: int, received: int) -> DataLoss:
+    return DataLoss(details=f'Chunked payload announced {size} bytes, but {received} bytes were received')
+
+
+def split_chunks(data: bytes, chunk_size: int, chunk_type: Type[ProtoMessage]) -> Iterator[ProtoMessage]:
+    yield chunk_type(data=data[:chunk_size], size=len(data))  # noqa: data, size
+    for offset in range(chunk_size, len(data), chunk_size):
+        yield chunk_type(data=data[offset:offset + chunk_size])  # noqa: data
+
+
+async def join_chunks(chunks: AsyncIterable[ProtoMessage], max_size: int | None = None) -> bytearray:
+    buffer: bytearray = bytearray()
+    size: int | None = None
+    async for chunk in chunks:
+        if size is None:
+            # only the first chunk announces the payload size, the buffer is then bounded by it
+            size: int = chunk.size
+            if max_size is not None and size > max_size:
+                raise payload_too_large(size=size, max_size=max_size)
+        if len(buffer) + len(chunk.data) > size:
+            raise payload_size_mismatch(size=size, received=len(buffer) + len(chunk.data))
+        buffer += chunk.data
+    if size is None:
+        raise DataLoss(details='Chunked payload ended before its first chunk')
+    if len(buffer) != size:
+        raise payload_size_mismatch(size=size, received=len(buffer))
+    return buffer
@@ -0,0 +1,96 @@
+from enum import Enum
+from uuid import UUID
+from typing import Any, Type
+from abc import ABC, abstractmethod
+from datetime import date, time, datetime
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from py_grpcio.ndarray import is_ndarray_value, ndarray_to_envelope, ndarray_to_json
+
+
+class BaseCodec(ABC):
+    @abstractmethod
+    def encode(self: 'BaseCodec', message: BaseModel) -> bytes:
+        ...
+
+    @abstractmethod
+    def decode(self: 'BaseCodec', data: bytes, model: Type[BaseModel]) -> BaseModel:
+        ...
+
+    @abstractmethod
+    def loads(self: 'BaseCodec', data: bytes) -> dict[str, Any]:
+        ...
+
+    def decode_blobs(self: 'BaseCodec', data: bytes, model: Type[BaseModel], blobs: dict[str, bytes]) -> BaseModel:
+        # uuids, datetimes and the like arrive as strings, which strict python validation rejects unlike json validation
+        return model.model_validate({**self.loads(data=data), **blobs}, strict=False)
+
+
+class JsonCodec(BaseCodec):
+    def encode(self: 'JsonCodec', message: BaseModel) -> bytes:
+        return message.__pydantic_serializer__.to_json(message)
+
+    def decode(self: 'JsonCodec', data: bytes, model: Type[BaseModel]) -> BaseModel:
+        return model.__pydantic_validator__.validate_json(data)
+
+    def loads(self: 'JsonCodec', data: bytes) -> dict[str, Any]:
+        return from_json(data)
+
+
+class OrjsonCodec(BaseCodec):
+    def __init__(self: 'OrjsonCodec'):
+        try:
+            import orjson
+        except ImportError as exc:
+            raise ImportError('OrjsonCodec requires `orjson`: pip install py-grpcio[orjson]') from exc
+        self.orjson: Any = orjson
+
+    @classmethod
+    def default(cls: Type['OrjsonCodec'], value: Any) -> Any:
+        if is_ndarray_value(value=value):
+            return ndarray_to_json(value=value)
+        raise TypeError(f'Type is not JSON serializable: {value.__class__.__name__}')
+
+    def encode(self: 'OrjsonCodec', message: BaseModel) -> bytes:
+        # pydantic-core writes and validates the same json directly, orjson only parses payloads with blobs
+        return message.__pydantic_serializer__.to_json(message, fallback=self.default)
+
+    def decode(self: 'OrjsonCodec', data: bytes, model: Type[BaseModel]) -> BaseModel:
+        return model.__pydantic_validator__.validate_json(data)
+
+    def loads(self: 'OrjsonCodec', data: bytes) -> dict[str, Any]:
+        return self.orjson.loads(data)
+
+
+class MsgpackCodec(BaseCodec):
+    def __init__(self: 'MsgpackCodec'):
+        try:
+            import msgpack
+        except ImportError as exc:
+            raise ImportError('MsgpackCodec requires `msgpack`: pip install py-grpcio[msgpack]') from exc
+        self.msgpack: Any = msgpack
+
+    @classmethod
+    def default(cls: Type['MsgpackCodec'], value: Any) -> Any:
+        if isinstance(value, set | frozenset | tuple):
+            return list(value)
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, date | time | datetime):
+            return value.isoformat()
+        if isinstance(value, Enum):
+            return value.value
+        if is_ndarray_value(value=value):
+            return ndarray_to_envelope(value=value)
+        raise TypeError(f'Type is not msgpack serializable: {value.__class__.__name__}')
+
+    def encode(self: 'MsgpackCodec', message: BaseModel) -> bytes:
+        return self.msgpack.packb(message.model_dump(), default=self.default)
+
+    def decode(self: 'MsgpackCodec', data: bytes, model: Type[BaseModel]) -> BaseModel:
+        return model.model_validate(self.msgpack.unpackb(data), strict=False)
+
+    def loads(self: 'MsgpackCodec', data: bytes) -> dict[str, Any]:
+        return self.msgpack.unpackb(data)
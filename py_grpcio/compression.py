@@ -0,0 +1,23 @@
+from typing import assert_never
+
+from grpc import Compression
+
+from py_grpcio.enums import Compressions
+
+DEFAULT_COMPRESSION_THRESHOLD: int = 1024
+
+
+def grpc_compression(compression: Compressions) -> Compression:
+    match compression:
+        case Compressions.GZIP:
+            return Compression.Gzip
+        case Compressions.DEFLATE:
+            return Compression.Deflate
+        case _:
+            return assert_never(compression)
+
+
+def select_compression(compression: Compressions | None, threshold: int, size: int) -> Compression | None:
+    if compression is None or size < threshold:
+        return None
+    return grpc_compression(compression=compression)
@@ -0,0 +1,286 @@
+from enum import Enum
+from uuid import UUID
+from inspect import isclass
+from functools import partial
+from types import ModuleType, UnionType, NoneType
+from datetime import date, time, datetime, timedelta, timezone
+from collections.abc import Iterable, Mapping
+from typing import Any, Type, Callable, Union, Annotated, get_origin, get_args
+
+from pydantic import TypeAdapter, PlainSerializer, WrapSerializer
+from pydantic.fields import FieldInfo  # noqa: FieldInfo
+
+from google.protobuf.message import Message as ProtoMessage
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from py_grpcio.models import Message
+from py_grpcio.blob import is_blob, blob_bytes
+from py_grpcio.ndarray import (
+    is_ndarray, packed_field, encode_packed, decode_packed, ndarray_to_envelope, decode_envelope
+)
+from py_grpcio.proto import ProtoBufTypes, get_field_type, get_proto_type
+
+type Encoder = Callable[[Any], Any]
+type Decoder = Callable[[Any], Any]
+
+SCALAR_TYPES: frozenset[type] = frozenset({int, float, bool, str, bytes})
+SERIALIZERS: tuple[type, ...] = (PlainSerializer, WrapSerializer)
+
+ENCODERS: dict[type, Encoder] = {
+    UUID: str,
+    date: date.isoformat,
+    time: time.isoformat,
+    datetime: datetime.isoformat,
+}
+
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND: timedelta = timedelta(microseconds=1)
+
+
+def uuid_bytes(value: UUID) -> bytes:
+    return value.bytes
+
+
+def utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def datetime_to_micros(value: datetime) -> int:
+    return (utc(value=value) - EPOCH) // MICROSECOND
+
+
+def micros_to_datetime(value: int) -> datetime:
+    return EPOCH + value * MICROSECOND
+
+
+def datetime_to_timestamp(value: datetime) -> Timestamp:
+    timestamp: Timestamp = Timestamp()
+    timestamp.FromDatetime(dt=utc(value=value))
+    return timestamp
+
+
+def timestamp_to_datetime(value: Timestamp) -> datetime:
+    return value.ToDatetime(tzinfo=timezone.utc)
+
+
+OVERRIDE_ENCODERS: dict[tuple[type, ProtoBufTypes], Encoder] = {
+    (UUID, ProtoBufTypes.BYTES): uuid_bytes,
+    (datetime, ProtoBufTypes.INT64): datetime_to_micros,
+    (datetime, ProtoBufTypes.TIMESTAMP): datetime_to_timestamp,
+}
+
+OVERRIDE_DECODERS: dict[tuple[type, ProtoBufTypes], Decoder] = {
+    (datetime, ProtoBufTypes.INT64): micros_to_datetime,
+    (datetime, ProtoBufTypes.TIMESTAMP): timestamp_to_datetime,
+}
+
+
+def unwrap_annotation(annotation: Any) -> Any:
+    origin: Any = get_origin(annotation)
+    if origin is Annotated:
+        return unwrap_annotation(annotation=get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        args: list[Any] = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return unwrap_annotation(annotation=args[0])
+    return annotation
+
+
+def is_message(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, Message)
+
+
+def is_packed_array(annotation: Any) -> bool:
+    return is_ndarray(annotation=annotation) and annotation.dtype is not None
+
+
+def is_scalar(annotation: Any) -> bool:
+    return annotation in SCALAR_TYPES
+
+
+def has_empty_default(field_info: FieldInfo) -> bool:
+    if field_info.default_factory is not None:
+        return field_info.default_factory in (list, dict, set)
+    return isinstance(field_info.default, list | dict | set) and not field_info.default
+
+
+def has_serializer(annotation: Any) -> bool:
+    if get_origin(annotation) is Annotated:
+        _, *metadata = get_args(annotation)
+        if any(isinstance(item, SERIALIZERS) for item in metadata):
+            return True
+    return any(has_serializer(annotation=arg) for arg in get_args(annotation))
+
+
+def get_serialized_fields(model: Type[Message]) -> set[str]:
+    decorators: Any = model.__pydantic_decorators__
+    fields: set[str] = {
+        field_name for serializer in decorators.field_serializers.values() for field_name in serializer.info.fields
+    }
+    if decorators.model_serializers or '*' in fields:
+        return set(model.model_fields)
+    return fields | {
+        field_name for field_name, field_info in model.model_fields.items()
+        if any(isinstance(item, SERIALIZERS) for item in field_info.metadata)
+        or has_serializer(annotation=field_info.annotation)
+    }
+
+
+def enum_value(value: Enum | Any) -> Any:
+    # models with `use_enum_values` already hold the raw value
+    return getattr(value, 'value', value)
+
+
+def convert_list(converter: Callable[[Any], Any], values: Iterable[Any]) -> list[Any]:
+    return [converter(value) for value in values]
+
+
+def convert_dict(converter: Callable[[Any], Any], values: Mapping[Any, Any]) -> dict[Any, Any]:
+    return {key: converter(value) for key, value in values.items()}
+
+
+class MessageConverter:
+    def __init__(
+        self: 'MessageConverter',
+        model: Type[Message],
+        proto: Type[ProtoMessage],
+        converters: dict[str, 'MessageConverter']
+    ):
+        self.model: Type[Message] = model
+        self.proto: Type[ProtoMessage] = proto
+        self.converters: dict[str, MessageConverter] = converters
+        self.encoders: list[tuple[str, Encoder | None]] = []
+        self.decoders: list[tuple[str, Decoder | None, bool, bool]] = []
+        self.arrays: list[tuple[str, bytes, Any]] = []
+        self.serialized: set[str] = set()
+        for field_name, field_info in self.model.model_fields.items():
+            if is_packed_array(annotation=(annotation := unwrap_annotation(annotation=field_info.annotation))):
+                field_number: int = self.proto.DESCRIPTOR.fields_by_name[field_name].number
+                self.arrays.append((field_name, *packed_field(field_number=field_number, dtype=annotation.dtype)))
+
+    def compile(self: 'MessageConverter') -> None:
+        # fields with custom serializers keep the generic pydantic dump
+        serialized: set[str] = get_serialized_fields(model=self.model)
+        for field_name, field_info in self.model.model_fields.items():
+            field_type: Any = get_field_type(field_info=field_info)
+            annotation: Any = unwrap_annotation(annotation=field_type)
+            blob: bool = is_blob(field_info=field_info)
+            if field_name in serialized and not blob and not is_packed_array(annotation=annotation):
+                self.serialized.add(field_name)
+            elif not is_packed_array(annotation=annotation):
+                self.encoders.append((field_name, blob_bytes if blob else self.compile_encoder(annotation=field_type)))
+            self.decoders.append((
+                field_name,
+                None if blob else self.compile_decoder(annotation=field_type),
+                field_info.is_required() or has_empty_default(field_info=field_info),
+                is_message(annotation=annotation)
+                or (is_ndarray(annotation=annotation) and not is_packed_array(annotation=annotation))
+                or get_proto_type(annotation=field_type) is ProtoBufTypes.TIMESTAMP
+            ))
+
+    def compile_encoder(
+        self: 'MessageConverter',
+        annotation: Any,
+        proto_type: ProtoBufTypes | None = None
+    ) -> Encoder | None:
+        proto_type: ProtoBufTypes | None = get_proto_type(annotation=annotation) or proto_type
+        annotation: Any = unwrap_annotation(annotation=annotation)
+        if proto_type is not None and (encoder := OVERRIDE_ENCODERS.get((annotation, proto_type))):
+            return encoder
+        if is_scalar(annotation=annotation):
+            return None
+        if is_message(annotation=annotation):
+            converter: MessageConverter = self.converters[annotation.__name__]
+            return converter.to_proto if converter.arrays else converter.encode
+        if is_ndarray(annotation=annotation):
+            return ndarray_to_envelope
+        if isclass(annotation) and issubclass(annotation, Enum):
+            return enum_value
+        if encoder := ENCODERS.get(annotation):
+            return encoder
+        if (origin := get_origin(annotation)) is not None and isclass(origin):
+            args: tuple[Any, ...] = get_args(annotation)
+            if issubclass(origin, dict):
+                if len(args) == 2 and is_scalar(annotation=unwrap_annotation(annotation=args[0])):
+                    if (encoder := self.compile_encoder(annotation=args[1], proto_type=proto_type)) is None:
+                        return None if origin is dict else dict
+                    return partial(convert_dict, encoder)
+            elif len(args) == 1:
+                if (encoder := self.compile_encoder(annotation=args[0], proto_type=proto_type)) is None:
+                    return None if origin is list else list
+                return partial(convert_list, encoder)
+        return partial(TypeAdapter(annotation).dump_python, mode='json')
+
+    def compile_decoder(
+        self: 'MessageConverter',
+        annotation: Any,
+        proto_type: ProtoBufTypes | None = None
+    ) -> Decoder | None:
+        proto_type: ProtoBufTypes | None = get_proto_type(annotation=annotation) or proto_type
+        annotation: Any = unwrap_annotation(annotation=annotation)
+        if proto_type is not None and (decoder := OVERRIDE_DECODERS.get((annotation, proto_type))):
+            return decoder
+        if is_message(annotation=annotation):
+            return self.converters[annotation.__name__].decode
+        if is_ndarray(annotation=annotation):
+            return decode_envelope if annotation.dtype is None else partial(decode_packed, annotation.dtype)
+        if (origin := get_origin(annotation)) is not None and isclass(origin):
+            args: tuple[Any, ...] = get_args(annotation)
+            if issubclass(origin, dict):
+                if len(args) == 2:
+                    if (decoder := self.compile_decoder(annotation=args[1], proto_type=proto_type)) is not None:
+                        return partial(convert_dict, decoder)
+                return dict
+            if len(args) == 1:
+                if (decoder := self.compile_decoder(annotation=args[0], proto_type=proto_type)) is not None:
+                    return partial(convert_list, decoder)
+            return list
+        return None
+
+    def encode(self: 'MessageConverter', message: Message) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        for field_name, encoder in self.encoders:
+            if (value := getattr(message, field_name)) is not None:
+                params[field_name] = value if encoder is None else encoder(value)
+        if self.serialized:
+            params.update(message.model_dump(mode='json', include=self.serialized, exclude_none=True, warnings=False))
+        return params
+
+    def decode(self: 'MessageConverter', message: ProtoMessage) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        for field_name, decoder, required, nested in self.decoders:
+            if nested:
+                if message.HasField(field_name):
+                    params[field_name] = decoder(getattr(message, field_name))
+            elif (value := getattr(message, field_name)) or required:
+                params[field_name] = value if decoder is None else decoder(value)
+        return params
+
+    def encode_arrays(self: 'MessageConverter', message: Message) -> bytes:
+        return b''.join(
+            encode_packed(tag=tag, dtype=dtype, value=value)
+            for field_name, tag, dtype in self.arrays
+            if (value := getattr(message, field_name)) is not None
+        )
+
+    def to_proto(self: 'MessageConverter', message: Message) -> ProtoMessage:
+        proto: ProtoMessage = self.proto(**self.encode(message))  # noqa: args, kwargs
+        if self.arrays:
+            proto.MergeFromString(self.encode_arrays(message=message))
+        return proto
+
+    def to_pydantic(self: 'MessageConverter', message: ProtoMessage) -> Message:
+        return self.model.model_validate(self.decode(message))
+
+
+def compile_converters(messages: dict[str, Type[Message]], protos: ModuleType) -> dict[str, MessageConverter]:
+    converters: dict[str, MessageConverter] = {}
+    for message_name, message in messages.items():
+        converters[message_name] = MessageConverter(
+            model=message,
+            proto=getattr(protos, message_name),
+            converters=converters
+        )
+    for converter in converters.values():
+        converter.compile()
+    return converters
@@ -0,0 +1,30 @@
+from time import monotonic
+from contextvars import ContextVar
+
+from grpc_interceptor.exceptions import DeadlineExceeded
+
+type Delay = float
+
+deadline: ContextVar[float | None] = ContextVar('deadline', default=None)
+
+
+def set_deadline(time_remaining: Delay | None) -> None:
+    if time_remaining is None:
+        return
+    if time_remaining <= 0:
+        raise DeadlineExceeded(details='Deadline expired before the request was handled')
+    deadline.set(monotonic() + time_remaining)
+
+
+def remaining_time() -> Delay | None:
+    if (expires := deadline.get()) is None:
+        return None
+    return expires - monotonic()
+
+
+def get_timeout(timeout: Delay | None) -> Delay | None:
+    if (remaining := remaining_time()) is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded(details='Deadline of the inbound request expired before the call was sent')
+    return remaining if timeout is None else min(timeout, remaining)
@@ -0,0 +1,103 @@
+from typing import Any, Callable
+
+from py_grpcio.enums import Executors, Compressions
+from py_grpcio.chunks import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_PAYLOAD_SIZE
+
+type Func = Callable[..., Any]
+
+OPTIONS_ATTRIBUTE: str = '__method_options__'
+
+DEFAULT_BATCH_SIZE: int = 64
+DEFAULT_BATCH_DELAY: float = 0.002
+
+
+def get_method_options(func: Func) -> dict[str, Any]:
+    return getattr(func, OPTIONS_ATTRIBUTE, {})
+
+
+def set_method_options(func: Func, **options: Any) -> Func:
+    setattr(func, OPTIONS_ATTRIBUTE, {**get_method_options(func=func), **options})
+    return func
+
+
+def executor(kind: Executors | str) -> Callable[[Func], Func]:
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, executor=Executors(kind))
+    return decorator
+
+
+def timeout(seconds: float | None) -> Callable[[Func], Func]:
+    if seconds is not None and seconds <= 0:
+        raise ValueError(f'Timeout must be positive, not {seconds}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, timeout=seconds)
+    return decorator
+
+
+def concurrency_limit(limit: int, queue_size: int = 0) -> Callable[[Func], Func]:
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, max_concurrency=limit, max_queue=queue_size)
+    return decorator
+
+
+def compressed(algorithm: Compressions | str, threshold: int | None = None) -> Callable[[Func], Func]:
+    if threshold is not None and threshold < 0:
+        raise ValueError(f'Compression threshold can not be negative, not {threshold}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, compression=Compressions(algorithm), compression_threshold=threshold)
+    return decorator
+
+
+def chunked(
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_size: int | None = DEFAULT_MAX_PAYLOAD_SIZE
+) -> Callable[[Func], Func]:
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, not {chunk_size}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, chunk_size=chunk_size, max_payload_size=max_size)
+    return decorator
+
+
+def cached(ttl: float, skip_middlewares: bool = False) -> Callable[[Func], Func]:
+    if ttl <= 0:
+        raise ValueError(f'Cache ttl must be positive, not {ttl}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, cache_ttl=ttl, cache_skip_middlewares=skip_middlewares)
+    return decorator
+
+
+def hedged(delay: float | None = None, percentile: float = 95.0) -> Callable[[Func], Func]:
+    if delay is not None and delay <= 0:
+        raise ValueError(f'Hedge delay must be positive, not {delay}')
+    if not 0 < percentile < 100:
+        raise ValueError(f'Hedge percentile must be between 0 and 100, not {percentile}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, hedge_delay=delay, hedge_percentile=percentile)
+    return decorator
+
+
+def single_flight(func: Func) -> Func:
+    return set_method_options(func=func, single_flight=True)
+
+
+def batched(max_size: int = DEFAULT_BATCH_SIZE, max_delay: float = DEFAULT_BATCH_DELAY) -> Callable[[Func], Func]:
+    if max_size < 1:
+        raise ValueError(f'Batch size must be positive, not {max_size}')
+    if max_delay < 0:
+        raise ValueError(f'Batch delay can not be negative, not {max_delay}')
+
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, batch_size=max_size, batch_delay=max_delay)
+    return decorator
+
+
+def batch_handler(method_name: str) -> Callable[[Func], Func]:
+    def decorator(func: Func) -> Func:
+        return set_method_options(func=func, batch_for=method_name)
+    return decorator
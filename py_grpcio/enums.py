@@ -4,3 +4,34 @@ from enum import StrEnum
 class ServiceModes(StrEnum):
     DEFAULT = 'default'
     BYTES = 'bytes'
+
+
+class Executors(StrEnum):
+    LOOP = 'loop'
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+
+class Stages(StrEnum):
+    DECODE = 'decode'
+    MIDDLEWARES = 'middlewares'
+    HANDLER = 'handler'
+    ENCODE = 'encode'
+    TOTAL = 'total'
+
+
+class Compressions(StrEnum):
+    GZIP = 'gzip'
+    DEFLATE = 'deflate'
+
+
+class Presets(StrEnum):
+    LOW_LATENCY = 'low_latency'
+    HIGH_THROUGHPUT = 'high_throughput'
+    LARGE_MESSAGE = 'large_message'
+
+
+class EventLoops(StrEnum):
+    ASYNCIO = 'asyncio'
+    UVLOOP = 'uvloop'
+    AUTO = 'auto'
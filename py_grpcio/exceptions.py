@@ -1,6 +1,13 @@
 from typing import Any
 
+from loguru import logger
+
+from pydantic import ValidationError
+
 from grpc import StatusCode
+from grpc_interceptor.exceptions import GrpcException
+
+STATUS_CODES: dict[int, StatusCode] = {status_code.value[0]: status_code for status_code in StatusCode}
 
 
 class PyGrpcIOException(Exception):
@@ -26,3 +33,31 @@ class RunTimeServerError(PyGrpcIOException):
         self.status_code: StatusCode = status_code
         self.details: Any = details
         super().__init__(text=f'status_code: {status_code} | details: {details}')
+
+
+class BatchItemError(PyGrpcIOException):
+    def __init__(self, status_code: StatusCode, details: str):
+        self.status_code: StatusCode = status_code
+        self.details: str = details
+        super().__init__(text=f'status_code: {status_code} | details: {details}')
+
+
+def exception_status(exc: Exception) -> tuple[StatusCode, str, str | None]:
+    log_details: str | None = None
+    match exc:
+        case GrpcException():
+            code, details = exc.status_code, exc.details
+            log_details: str = f'{exc.__class__.__name__} | {exc.details}'
+        case SendEmpty():
+            code, details = StatusCode.ABORTED, exc.text
+        case RunTimeServerError():
+            code: StatusCode = exc.status_code
+            details: str = 'Internal Server Error' if exc.status_code == StatusCode.INTERNAL else exc.details
+            log_details: str = str(exc)
+        case ValidationError():
+            code, details = StatusCode.INVALID_ARGUMENT, exc.json()
+        case _:
+            # also called outside of an except block (batch items), so the traceback is passed explicitly
+            logger.opt(exception=exc).error(exc)
+            code, details = StatusCode.INTERNAL, 'Internal Server Error'
+    return code, details, log_details
@@ -0,0 +1,73 @@
+from time import perf_counter
+from typing import Any, assert_never
+from functools import partial
+from inspect import isawaitable
+from multiprocessing import get_context
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from py_grpcio.enums import Executors
+from py_grpcio.models import Target
+from py_grpcio.metrics import handler_time
+from py_grpcio.utils import block_signals
+
+
+class ExecutorPools:
+    def __init__(self: 'ExecutorPools', thread_workers: int | None = None, process_workers: int | None = None):
+        self.thread_workers: int | None = thread_workers
+        self.process_workers: int | None = process_workers
+        self.__thread_pool: ThreadPoolExecutor | None = None
+        self.__process_pool: ProcessPoolExecutor | None = None
+
+    @property
+    def thread_pool(self: 'ExecutorPools') -> ThreadPoolExecutor:
+        if self.__thread_pool is None:
+            self.__thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix='py-grpcio-handler',
+                initializer=block_signals
+            )
+        return self.__thread_pool
+
+    @property
+    def process_pool(self: 'ExecutorPools') -> ProcessPoolExecutor:
+        if self.__process_pool is None:
+            self.__process_pool = ProcessPoolExecutor(max_workers=self.process_workers, mp_context=get_context('spawn'))
+        return self.__process_pool
+
+    def shutdown(self: 'ExecutorPools', wait: bool = True) -> None:
+        thread_pool, self.__thread_pool = self.__thread_pool, None
+        process_pool, self.__process_pool = self.__process_pool, None
+        for pool in (thread_pool, process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class TargetExecutor:
+    def __init__(self: 'TargetExecutor', target: Target, executor: Executors, pools: ExecutorPools):
+        self.target: Target = target
+        self.func: Any = target.func
+        self.executor: Executors = executor
+        self.pools: ExecutorPools = pools
+
+    async def __call__(self: 'TargetExecutor', **kwargs: Any) -> Any:
+        started: float = perf_counter()
+        try:
+            return await self.execute(**kwargs)
+        finally:
+            handler_time.set(perf_counter() - started)
+
+    async def execute(self: 'TargetExecutor', **kwargs: Any) -> Any:
+        match self.executor:
+            case Executors.LOOP:
+                response: Any = self.target(**kwargs)
+                return await response if isawaitable(response) else response
+            case Executors.THREAD:
+                return await get_running_loop().run_in_executor(self.pools.thread_pool, partial(self.target, **kwargs))
+            case Executors.PROCESS:
+                return await get_running_loop().run_in_executor(
+                    self.pools.process_pool,
+                    partial(self.func, None, **kwargs)
+                )
+            case _:
+                return assert_never(self.executor)
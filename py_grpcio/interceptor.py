@@ -1,48 +1,91 @@
-from loguru import logger
-
-from pydantic import ValidationError
+from time import perf_counter
+from collections.abc import AsyncIterator
 
 from grpc import StatusCode
 from grpc.aio import ServicerContext
-from grpc_interceptor.exceptions import GrpcException
 from grpc_interceptor.server import AsyncServerInterceptor
 
 from google.protobuf.message import Message
 
+from py_grpcio.enums import Stages
 from py_grpcio.method import ServerMethodGRPC
-from py_grpcio.exceptions import SendEmpty, RunTimeServerError
+from py_grpcio.metrics import BaseMetricsExporter
+from py_grpcio.access_log import AccessLog
+from py_grpcio.exceptions import exception_status
 
 
 class ServerInterceptor(AsyncServerInterceptor):
+    def __init__(
+        self: 'ServerInterceptor',
+        metrics: BaseMetricsExporter | None = None,
+        access_log: AccessLog | None = None
+    ):
+        self.metrics: BaseMetricsExporter | None = metrics
+        self.access_log: AccessLog = access_log if access_log is not None else AccessLog()
+
+    def start(self: 'ServerInterceptor', route: ServerMethodGRPC) -> float:
+        if self.metrics is not None:
+            self.metrics.track_in_flight(method=route.name, delta=1)
+        return perf_counter()
+
+    def finish(
+        self: 'ServerInterceptor',
+        route: ServerMethodGRPC,
+        context: ServicerContext,
+        code: StatusCode,
+        started: float,
+        details: str | None = None
+    ) -> None:
+        elapsed: float = perf_counter() - started
+        if self.metrics is not None:
+            self.metrics.observe(method=route.name, stage=Stages.TOTAL, seconds=elapsed)
+            self.metrics.count_status(method=route.name, code=code)
+            self.metrics.track_in_flight(method=route.name, delta=-1)
+        self.access_log.record(method=route.name, code=code, duration=elapsed, context=context, details=details)
+
     async def intercept(
         self: 'ServerInterceptor',
         route: ServerMethodGRPC,
-        message: Message,
+        message: Message | AsyncIterator[Message],
         context: ServicerContext,
         method_name: str,
-    ) -> Message | None:
+    ) -> Message | AsyncIterator[Message] | None:
+        started: float = self.start(route=route)
+        code, details = StatusCode.CANCELLED, None
+        streaming: bool = False
         try:
-            response: Message | None = await route(message=message, context=context)
-            logger.info(f'{context.peer()} - {route.__qualname__}')
+            response: Message | AsyncIterator[Message] | None = await route(message=message, context=context)
+            if route.method.response_streaming or route.method.chunked:
+                streaming: bool = True
+                return self.intercept_stream(route=route, responses=response, context=context, started=started)
+            code: StatusCode = StatusCode.OK
             return response
-        except GrpcException as grpc_exc:
-            logger.error(
-                f'{context.peer()} - {route.__qualname__} | '
-                f'{grpc_exc.__class__.__name__} | {grpc_exc.status_code} | {grpc_exc.details}'
-            )
-            context.set_code(grpc_exc.status_code)
-            context.set_details(grpc_exc.details)
-        except SendEmpty as exc:
-            context.set_code(StatusCode.ABORTED)
-            context.set_details(exc.text)
-        except RunTimeServerError as exc:
-            logger.error(exc)
-            context.set_code(exc.status_code)
-            context.set_details('Internal Server Error' if exc.status_code == StatusCode.INTERNAL else exc.details)
-        except ValidationError as exc:
-            context.set_code(StatusCode.INVALID_ARGUMENT)
-            context.set_details(exc.json())
         except Exception as exc:
-            logger.exception(exc)
-            context.set_code(StatusCode.INTERNAL)
-            context.set_details('Internal Server Error')
+            code, details = self.handle_exception(context=context, exc=exc)
+        finally:
+            if not streaming:
+                self.finish(route=route, context=context, code=code, started=started, details=details)
+
+    async def intercept_stream(
+        self: 'ServerInterceptor',
+        route: ServerMethodGRPC,
+        responses: AsyncIterator[Message],
+        context: ServicerContext,
+        started: float
+    ) -> AsyncIterator[Message]:
+        code, details = StatusCode.CANCELLED, None
+        try:
+            async for response in responses:
+                yield response
+            code: StatusCode = StatusCode.OK
+        except Exception as exc:
+            code, details = self.handle_exception(context=context, exc=exc)
+        finally:
+            self.finish(route=route, context=context, code=code, started=started, details=details)
+
+    @classmethod
+    def handle_exception(cls, context: ServicerContext, exc: Exception) -> tuple[StatusCode, str | None]:
+        code, details, log_details = exception_status(exc=exc)
+        context.set_code(code)
+        context.set_details(details)
+        return code, log_details
@@ -0,0 +1,75 @@
+from collections import deque
+from asyncio import Future, CancelledError, get_running_loop
+
+from grpc_interceptor.exceptions import ResourceExhausted
+
+SERVICE_TIME_WEIGHT: float = 0.2
+
+
+class ConcurrencyLimiter:
+    def __init__(self: 'ConcurrencyLimiter', limit: int, queue_size: int = 0, name: str = 'server'):
+        if limit < 1:
+            raise ValueError(f'Concurrency limit must be positive, not {limit}')
+        if queue_size < 0:
+            raise ValueError(f'Queue size can not be negative, not {queue_size}')
+        self.limit: int = limit
+        self.queue_size: int = queue_size
+        self.name: str = name
+
+        self.active: int = 0
+        self.waiters: deque[Future] = deque()
+        self.service_time: float = 0.0
+
+        self.admitted: int = 0
+        self.queued: int = 0
+        self.shed: int = 0
+
+    @property
+    def stats(self: 'ConcurrencyLimiter') -> dict[str, int]:
+        return {
+            'active': self.active,
+            'waiting': len(self.waiters),
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'shed': self.shed,
+        }
+
+    @property
+    def expected_wait(self: 'ConcurrencyLimiter') -> float:
+        return (len(self.waiters) + 1) / self.limit * self.service_time
+
+    def reject(self: 'ConcurrencyLimiter', reason: str) -> ResourceExhausted:
+        self.shed += 1
+        return ResourceExhausted(details=f'{self.name} is overloaded: {reason}')
+
+    async def acquire(self: 'ConcurrencyLimiter', time_remaining: float | None = None) -> None:
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self.waiters) >= self.queue_size:
+            raise self.reject(reason='queue is full')
+        if time_remaining is not None and time_remaining < self.expected_wait + self.service_time:
+            raise self.reject(reason=f'expected wait {self.expected_wait:.3f}s exceeds deadline')
+        waiter: Future = get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.queued += 1
+        try:
+            await waiter
+        except CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            elif waiter in self.waiters:
+                self.waiters.remove(waiter)
+            raise
+        self.admitted += 1
+
+    def release(self: 'ConcurrencyLimiter', elapsed: float | None = None) -> None:
+        if elapsed is not None:
+            self.service_time += (SERVICE_TIME_WEIGHT if self.service_time else 1) * (elapsed - self.service_time)
+        while self.waiters:
+            waiter: Future = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
@@ -0,0 +1,26 @@
+from typing import Callable, assert_never
+from asyncio import AbstractEventLoop, new_event_loop
+
+from py_grpcio.enums import EventLoops
+
+type LoopFactory = Callable[[], AbstractEventLoop]
+
+
+def get_loop_factory(event_loop: EventLoops) -> LoopFactory:
+    match event_loop:
+        case EventLoops.ASYNCIO:
+            return new_event_loop
+        case EventLoops.UVLOOP:
+            try:
+                import uvloop
+            except ImportError as exc:
+                raise ImportError('EventLoops.UVLOOP requires `uvloop`: pip install py-grpcio[uvloop]') from exc
+            return uvloop.new_event_loop
+        case EventLoops.AUTO:
+            try:
+                import uvloop
+            except ImportError:
+                return new_event_loop
+            return uvloop.new_event_loop
+        case _:
+            return assert_never(event_loop)
@@ -1,27 +1,44 @@
-from typing import Any, Type, Callable, assert_never
-
-from asyncio import to_thread
-from warnings import catch_warnings
+from time import perf_counter
+from functools import partial
+from asyncio import gather
+from collections.abc import AsyncIterator, AsyncIterable, Awaitable, Iterable, Iterator
+from typing import Any, Type, assert_never
 
 from pydantic import ValidationError
 
-from grpc import experimental
-from grpc.aio import ServicerContext
+from grpc import StatusCode, Compression
+from grpc.aio import (
+    ServicerContext, UnaryStreamCall, StreamStreamCall,
+    UnaryUnaryMultiCallable, UnaryStreamMultiCallable, StreamUnaryMultiCallable, StreamStreamMultiCallable
+)
 
-from google.protobuf.message import Message as ProtoMessage
+from grpc_interceptor.exceptions import InvalidArgument
 
-from py_grpcio.enums import ServiceModes
-from py_grpcio.utils import snake_to_camel
-from py_grpcio.models import Target, Method, Message
-from py_grpcio.exceptions import SendEmpty, RunTimeServerError
+from google.protobuf.message import Message as ProtoMessage, DecodeError
 
-from py_grpcio.middleware import BaseMiddleware
+from py_grpcio.enums import ServiceModes, Stages, Compressions
+from py_grpcio.channel import ChannelPool
+from py_grpcio.balancer import LoadBalancer, HedgePolicy
+from py_grpcio.utils import snake_to_camel, request_digest
+from py_grpcio.blob import get_blob_fields, blob_bytes
+from py_grpcio.chunks import split_chunks, join_chunks
+from py_grpcio.models import Method, Message
+from py_grpcio.exceptions import SendEmpty, RunTimeServerError, BatchItemError, STATUS_CODES, exception_status
+from py_grpcio.batching import RequestBatcher, PendingBatch, BatchSlot, batch_slot
+from py_grpcio.single_flight import SingleFlight
+from py_grpcio.cache import ResponseCache, cache_request_key
+from py_grpcio.deadline import set_deadline, get_timeout
+from py_grpcio.compression import DEFAULT_COMPRESSION_THRESHOLD, grpc_compression, select_compression
 
-from py_grpcio.proto.enums import ProtoBufTypes
+from py_grpcio.middleware import BaseMiddleware
+from py_grpcio.executors import ExecutorPools, TargetExecutor
+from py_grpcio.limiter import ConcurrencyLimiter
+from py_grpcio.metrics import BaseMetricsExporter, handler_time
 
 type Delay = float
-type Service = type
-type MethodType = Callable[[ProtoMessage, str, bool], ProtoMessage]
+type MultiCallable = (
+    UnaryUnaryMultiCallable | UnaryStreamMultiCallable | StreamUnaryMultiCallable | StreamStreamMultiCallable
+)
 
 
 class MethodGRPC:
@@ -38,177 +55,709 @@ class MethodGRPC:
         model: Type[Message],
         method: Method
     ) -> Message:
-        params: dict[str, Any] = {}
-        for descriptor, value in message.ListFields():
-            if isinstance(value, ProtoMessage):
-                value: Message = cls.proto_to_pydantic(
-                    message=value,
-                    model=method.get_additional_message(message_name=descriptor.message_type.name),
-                    method=method
-                )
-            params[descriptor.name]: Any = value
-        return model(**params)
+        return method.get_converter(message_name=model.__name__).to_pydantic(message)
 
     @classmethod
     def pydantic_to_proto(
         cls: Type['MethodGRPC'],
         message: Message,
         model: Type[ProtoMessage],
-        method: Method,
-        warnings: bool = False,
-        exclude_types: set[ProtoBufTypes | str] | None = None
+        method: Method
     ) -> ProtoMessage:
-        exclude_types: set[ProtoBufTypes | str] = exclude_types or {ProtoBufTypes.BYTES}
-        exclude: set[str] = {field.name for field in message.fields() if field.type in exclude_types}
-        dump: dict[str, Any] = message.model_dump(mode='json', warnings=warnings, exclude=exclude)
-        params: dict[str, Any] = {}
-        for field_name, field_info in message.model_fields.items():
-            if field_info.annotation.__name__ in method.additional_messages:
-                value: ProtoMessage = cls.pydantic_to_proto(
-                    message=getattr(message, field_name),
-                    model=method.get_additional_proto(proto_name=field_info.annotation.__name__),
-                    method=method,
-                    warnings=warnings,
-                    exclude_types=exclude_types
-                )
-            elif field_info.annotation is bytes:
-                value: bytes = getattr(message, field_name)
-            else:
-                value: Any = dump[field_name]
-            params[field_name] = value
-        return model(**params)  # noqa: args, kwargs
+        return method.get_converter(message_name=model.__name__).to_proto(message)
 
     @classmethod
     def pydantic_to_bytes(cls: Type['MethodGRPC'], message: Message, method: Method) -> ProtoMessage:
         message_type: Type[ProtoMessage] = method.get_additional_proto(proto_name='BytesMessage')
-        return message_type(bytes=message.model_dump_json().encode())  # noqa: bytes
+        if blob_fields := get_blob_fields(model=message.__class__):
+            return message_type(  # noqa: bytes, blobs
+                bytes=method.codec.encode(message=message),
+                blobs={field_name: blob_bytes(getattr(message, field_name)) for field_name in blob_fields}
+            )
+        return message_type(bytes=method.codec.encode(message=message))  # noqa: bytes
 
     @classmethod
-    def bytes_to_pydantic(cls: Type['MethodGRPC'], message: ProtoMessage, model: Type[Message]) -> Message:
-        return model.model_validate_json(json_data=getattr(message, 'bytes').decode())
+    def bytes_to_pydantic(
+        cls: Type['MethodGRPC'],
+        message: ProtoMessage,
+        model: Type[Message],
+        method: Method
+    ) -> Message:
+        if get_blob_fields(model=model):
+            return method.codec.decode_blobs(data=getattr(message, 'bytes'), model=model, blobs=dict(message.blobs))
+        return method.codec.decode(data=getattr(message, 'bytes'), model=model)
+
+    def to_proto(self: 'MethodGRPC', message: Message, model: Type[Message]) -> ProtoMessage:
+        match self.method.mode:
+            case ServiceModes.DEFAULT:
+                return self.pydantic_to_proto(
+                    message=message,
+                    model=self.method.get_additional_proto(proto_name=model.__name__),
+                    method=self.method
+                )
+            case ServiceModes.BYTES:
+                return self.pydantic_to_bytes(message=message, method=self.method)
+            case _:
+                return assert_never(self.method.mode)
+
+    def to_pydantic(self: 'MethodGRPC', message: ProtoMessage, model: Type[Message]) -> Message:
+        match self.method.mode:
+            case ServiceModes.DEFAULT:
+                return self.proto_to_pydantic(message=message, model=model, method=self.method)
+            case ServiceModes.BYTES:
+                return self.bytes_to_pydantic(message=message, model=model, method=self.method)
+            case _:
+                return assert_never(self.method.mode)
+
+    def to_chunks(self: 'MethodGRPC', message: ProtoMessage) -> Iterator[ProtoMessage]:
+        return split_chunks(
+            data=message.SerializeToString(),
+            chunk_size=self.method.chunk_size,
+            chunk_type=self.method.get_additional_proto(proto_name='ChunkMessage')
+        )
+
+    async def from_chunks(
+        self: 'MethodGRPC',
+        chunks: AsyncIterable[ProtoMessage],
+        proto: Type[ProtoMessage]
+    ) -> ProtoMessage:
+        return proto.FromString(await join_chunks(chunks=chunks, max_size=self.method.max_payload_size))
+
+    async def to_proto_stream(
+        self: 'MethodGRPC',
+        messages: AsyncIterable[Message],
+        model: Type[Message]
+    ) -> AsyncIterator[ProtoMessage]:
+        async for message in messages:
+            yield self.to_proto(message=message, model=model)
+
+    async def to_pydantic_stream(
+        self: 'MethodGRPC',
+        messages: AsyncIterable[ProtoMessage],
+        model: Type[Message]
+    ) -> AsyncIterator[Message]:
+        async for message in messages:
+            yield self.to_pydantic(message=message, model=model)
+
+
+class CacheMiddleware(BaseMiddleware):
+    def __init__(self: 'CacheMiddleware', target: TargetExecutor, server_method: 'ServerMethodGRPC'):
+        super().__init__(target=target)
+        self.server_method: ServerMethodGRPC = server_method
+
+    async def __call__(self: 'CacheMiddleware', request: Message, context: ServicerContext) -> Message:
+        cache: ResponseCache = self.server_method.cache
+        method: Method = self.server_method.method
+        if (key := cache_request_key.get()) is None:
+            return await self.call_target(request=request, context=context)
+        if (cached := cache.get(key=key)) is not None:
+            if not cache.encoded:
+                return cached.model_copy(deep=True)
+            return self.server_method.to_pydantic(message=cached, model=method.validation_response)
+        response: Message | None = await self.call_target(request=request, context=context)
+        if response:
+            # only the handler response is cached, what the outer middlewares make of it stays per caller
+            proto_response: ProtoMessage = self.server_method.to_proto(
+                message=response,
+                model=method.validation_response
+            )
+            cache.set(
+                key=key,
+                value=proto_response if cache.encoded else response.model_copy(deep=True),
+                size=proto_response.ByteSize(),
+                ttl=method.cache_ttl
+            )
+        return response
+
+
+class BatchJoinMiddleware(BaseMiddleware):
+    async def __call__(self: 'BatchJoinMiddleware', request: Message, context: ServicerContext) -> Message:
+        return await batch_slot.get().join(request=request)
 
 
 class ServerMethodGRPC(MethodGRPC):
-    def __init__(self, method: Method, middlewares: set[Type[BaseMiddleware]]):
+    def __init__(
+        self,
+        method: Method,
+        middlewares: set[Type[BaseMiddleware]],
+        executor_pools: ExecutorPools | None = None,
+        limiter: ConcurrencyLimiter | None = None,
+        metrics: BaseMetricsExporter | None = None,
+        cache: ResponseCache | None = None,
+        compression: Compressions | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        compression_enabled: bool = False
+    ):
         super().__init__(method=method)
+        self.name: str = self.method.target.func.__qualname__
         self.middlewares: set[Type[BaseMiddleware]] = middlewares
+        self.metrics: BaseMetricsExporter | None = metrics
+        self.cache: ResponseCache | None = cache if self.method.cached else None
+        # a cached response must not be served before auth-like middlewares have accepted the request
+        self.cache_first: bool = not self.middlewares or self.method.cache_skip_middlewares
+        self.compression: Compressions | None = (
+            self.method.compression if self.method.compression is not None else compression
+        )
+        self.compression_threshold: int = (
+            self.method.compression_threshold if self.method.compression_threshold is not None
+            else compression_threshold
+        )
+        # the grpc server compresses every message once it has a default algorithm, so other methods opt out
+        self.compression_enabled: bool = compression_enabled or self.compression is not None
+
+        self.limiter: ConcurrencyLimiter | None = None
+        if self.method.max_concurrency is not None:
+            self.limiter: ConcurrencyLimiter = ConcurrencyLimiter(
+                limit=self.method.max_concurrency,
+                queue_size=self.method.max_queue,
+                name=self.name
+            )
+        self.limiters: list[ConcurrencyLimiter] = [
+            limiter for limiter in (self.limiter, limiter) if limiter is not None
+        ]
 
-        self.target: Target = self.method.target
+        self.target: TargetExecutor = TargetExecutor(
+            target=self.method.target,
+            executor=self.method.executor,
+            pools=executor_pools or ExecutorPools()
+        )
         self.wrapped_target: BaseMiddleware | None = None
         self.wrap_target()
 
     def wrap_target(self) -> None:
+        if self.cache is not None and not self.cache_first:
+            self.wrapped_target = CacheMiddleware(target=self.target, server_method=self)
         for middleware in self.middlewares:
             self.wrapped_target = middleware(target=self.wrapped_target or self.target)
 
-    async def call_target(self, request: Message, context: ServicerContext) -> Message:
+    def observe(self: 'ServerMethodGRPC', stage: Stages, started: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(method=self.name, stage=stage, seconds=perf_counter() - started)
+
+    def observe_target(self: 'ServerMethodGRPC', started: float) -> None:
+        if self.metrics is not None:
+            elapsed: float = perf_counter() - started
+            self.metrics.observe(method=self.name, stage=Stages.HANDLER, seconds=handler_time.get())
+            if self.wrapped_target:
+                self.metrics.observe(method=self.name, stage=Stages.MIDDLEWARES, seconds=elapsed - handler_time.get())
+
+    async def call_target(
+        self,
+        request: Message | AsyncIterator[Message],
+        context: ServicerContext
+    ) -> Message | AsyncIterator[Message]:
         if self.wrapped_target:
-            response: Message | None = await self.wrapped_target(request=request, context=context)
+            response: Message | AsyncIterator[Message] | None = await self.wrapped_target(
+                request=request,
+                context=context
+            )
         else:
-            response: Message | None = await self.target(request=request)
+            response: Message | AsyncIterator[Message] | None = await self.target(request=request)
         if not response:
             raise SendEmpty(text='Method did not return anything')
         return response
 
-    async def default_call(
+    async def request_stream(self: 'ServerMethodGRPC', messages: AsyncIterator[ProtoMessage]) -> AsyncIterator[Message]:
+        try:
+            async for request in self.to_pydantic_stream(messages=messages, model=self.method.validation_request):
+                yield request
+        except ValidationError as exc:
+            raise InvalidArgument(details=exc.json())
+
+    async def request_chunks(self: 'ServerMethodGRPC', chunks: AsyncIterator[ProtoMessage]) -> ProtoMessage:
+        try:
+            return await self.from_chunks(chunks=chunks, proto=self.method.proto_request)
+        except DecodeError as exc:
+            raise InvalidArgument(details=f'Chunked request can not be parsed: {exc}')
+
+    async def acquire(self: 'ServerMethodGRPC', context: ServicerContext) -> float:
+        acquired: list[ConcurrencyLimiter] = []
+        try:
+            for limiter in self.limiters:
+                await limiter.acquire(time_remaining=context.time_remaining())
+                acquired.append(limiter)
+        except BaseException:
+            for limiter in acquired:
+                limiter.release()
+            raise
+        return perf_counter()
+
+    def release(self: 'ServerMethodGRPC', started: float) -> None:
+        elapsed: float = perf_counter() - started
+        for limiter in self.limiters:
+            limiter.release(elapsed=elapsed)
+
+    def compress(self: 'ServerMethodGRPC', context: ServicerContext, size: int) -> bool:
+        if (compression := select_compression(self.compression, self.compression_threshold, size)) is not None:
+            context.set_compression(compression)
+            return True
+        context.disable_next_message_compression()
+        return False
+
+    async def stream_call(
         self: 'ServerMethodGRPC',
-        message: ProtoMessage,
-        context: ServicerContext
-    ) -> ProtoMessage | None:
-        request: Message = self.proto_to_pydantic(
-            message=message,
-            model=self.method.validation_request,
-            method=self.method
-        )
+        responses: AsyncIterator[Message],
+        context: ServicerContext,
+        started: float | None = None
+    ) -> AsyncIterator[ProtoMessage]:
+        if self.compression is not None:
+            context.set_compression(grpc_compression(compression=self.compression))
         try:
-            response: Message = await self.call_target(request=request, context=context)
-            return self.pydantic_to_proto(message=response, model=self.method.proto_response, method=self.method)
+            async for response in responses:
+                proto_response: ProtoMessage = self.to_proto(message=response, model=self.method.validation_response)
+                if self.compression_enabled and (
+                    self.compression is None or proto_response.ByteSize() < self.compression_threshold
+                ):
+                    context.disable_next_message_compression()
+                yield proto_response
         except ValidationError as exc:
             raise RunTimeServerError(details={'validation_error': exc.json()})
+        finally:
+            if started is not None:
+                self.release(started=started)
 
-    async def bytes_call(
+    async def chunk_call(
         self: 'ServerMethodGRPC',
-        message: ProtoMessage,
-        context: ServicerContext
-    ) -> ProtoMessage | None:
-        request: Message = self.bytes_to_pydantic(message=message, model=self.method.validation_request)
+        response: ProtoMessage,
+        context: ServicerContext,
+        compressed: bool,
+        started: float | None = None
+    ) -> AsyncIterator[ProtoMessage]:
         try:
-            response: Message = await self.call_target(request=request, context=context)
-            return self.pydantic_to_bytes(message=response, method=self.method)
+            for chunk in self.to_chunks(message=response):
+                if self.compression_enabled and not compressed:
+                    context.disable_next_message_compression()
+                yield chunk
+        finally:
+            if started is not None:
+                self.release(started=started)
+
+    def encode(self: 'ServerMethodGRPC', response: Message) -> ProtoMessage:
+        encode_started: float = perf_counter()
+        proto_response: ProtoMessage = self.to_proto(message=response, model=self.method.validation_response)
+        self.observe(stage=Stages.ENCODE, started=encode_started)
+        return proto_response
+
+    def respond(
+        self: 'ServerMethodGRPC',
+        response: ProtoMessage,
+        context: ServicerContext,
+        started: float | None = None
+    ) -> ProtoMessage | AsyncIterator[ProtoMessage]:
+        compressed: bool = self.compression_enabled and self.compress(context=context, size=response.ByteSize())
+        if self.method.chunked:
+            return self.chunk_call(response=response, context=context, compressed=compressed, started=started)
+        return response
+
+    async def call(
+        self: 'ServerMethodGRPC',
+        message: ProtoMessage | AsyncIterator[ProtoMessage],
+        context: ServicerContext,
+        started: float | None = None,
+        batch_item: bool = False
+    ) -> ProtoMessage | AsyncIterator[ProtoMessage] | None:
+        # items of a batch share its context, so the deadline and compression are set once per batch
+        if not batch_item:
+            set_deadline(time_remaining=context.time_remaining())
+        if self.method.chunked:
+            message: ProtoMessage = await self.request_chunks(chunks=message)
+        key: bytes | None = None
+        if self.cache is not None:
+            key: bytes = request_digest(name=self.name, data=message.SerializeToString(deterministic=True))
+            if not self.cache_first:
+                cache_request_key.set(key)
+            elif (cached := self.cache.get(key=key)) is not None:
+                cached_response: ProtoMessage = cached if self.cache.encoded else self.encode(response=cached)
+                if batch_item:
+                    return cached_response
+                return self.respond(response=cached_response, context=context, started=started)
+        decode_started: float = perf_counter()
+        if self.method.request_streaming:
+            request: AsyncIterator[Message] = self.request_stream(messages=message)
+        else:
+            request: Message = self.to_pydantic(message=message, model=self.method.validation_request)
+            self.observe(stage=Stages.DECODE, started=decode_started)
+        try:
+            target_started: float = perf_counter()
+            try:
+                response: Message | AsyncIterator[Message] = await self.call_target(request=request, context=context)
+            finally:
+                self.observe_target(started=target_started)
+            if self.method.response_streaming:
+                return self.stream_call(responses=response, context=context, started=started)
+            proto_response: ProtoMessage = self.encode(response=response)
         except ValidationError as exc:
             raise RunTimeServerError(details={'validation_error': exc.json()})
+        if key is not None and self.cache_first:
+            self.cache.set(
+                key=key,
+                value=proto_response if self.cache.encoded else response.model_copy(deep=True),
+                size=proto_response.ByteSize(),
+                ttl=self.method.cache_ttl
+            )
+        if batch_item:
+            return proto_response
+        return self.respond(response=proto_response, context=context, started=started)
 
     async def __call__(
         self: 'ServerMethodGRPC',
+        message: ProtoMessage | AsyncIterator[ProtoMessage],
+        context: ServicerContext
+    ) -> ProtoMessage | AsyncIterator[ProtoMessage] | None:
+        if not self.limiters:
+            return await self.call(message=message, context=context)
+        started: float = await self.acquire(context=context)
+        streaming: bool = False
+        try:
+            response: ProtoMessage | AsyncIterator[ProtoMessage] = await self.call(
+                message=message,
+                context=context,
+                started=started
+            )
+            streaming: bool = self.method.response_streaming or self.method.chunked
+            return response
+        finally:
+            if not streaming:
+                self.release(started=started)
+
+
+class ServerBatchMethodGRPC:
+    def __init__(
+        self: 'ServerBatchMethodGRPC',
+        server_method: ServerMethodGRPC,
+        executor_pools: ExecutorPools | None = None
+    ):
+        self.server_method: ServerMethodGRPC = server_method
+        self.method: Method = server_method.method
+        self.name: str = f'{server_method.name}_batch'
+        self.batch_target: TargetExecutor | None = None
+        if self.method.batch_target is not None:
+            self.batch_target: TargetExecutor = TargetExecutor(
+                target=self.method.batch_target,
+                executor=self.method.batch_executor,
+                pools=executor_pools or ExecutorPools()
+            )
+        self.wrapped_target: BaseMiddleware | None = None
+        if self.batch_target is not None and server_method.middlewares:
+            # every item passes the middlewares on its own, the innermost one adds it to the batch of the handler
+            self.wrapped_target = BatchJoinMiddleware(target=server_method.target)
+            for middleware in server_method.middlewares:
+                self.wrapped_target = middleware(target=self.wrapped_target)
+
+    async def call_item(
+        self: 'ServerBatchMethodGRPC',
         message: ProtoMessage,
         context: ServicerContext
-    ) -> ProtoMessage | None:
-        match self.method.mode:
-            case ServiceModes.DEFAULT:
-                return await self.default_call(message=message, context=context)
-            case ServiceModes.BYTES:
-                return await self.bytes_call(message=message, context=context)
-            case _:
-                return assert_never(self.method.mode)
+    ) -> ProtoMessage | Exception:
+        try:
+            if not self.server_method.limiters:
+                return await self.server_method.call(message=message, context=context, batch_item=True)
+            # every item runs the handler, so it takes its own slot of the limiters
+            started: float = await self.server_method.acquire(context=context)
+            try:
+                return await self.server_method.call(message=message, context=context, batch_item=True)
+            finally:
+                self.server_method.release(started=started)
+        except Exception as exc:
+            return exc
+
+    def encode_item(self: 'ServerBatchMethodGRPC', response: Message) -> ProtoMessage | Exception:
+        try:
+            return self.server_method.to_proto(message=response, model=self.method.validation_response)
+        except ValidationError as exc:
+            return RunTimeServerError(details={'validation_error': exc.json()})
+
+    async def run_batch_target(
+        self: 'ServerBatchMethodGRPC',
+        requests: list[Message],
+        context: ServicerContext
+    ) -> list[Message]:
+        kwargs: dict[str, Any] = {'requests': requests}
+        if 'context' in self.batch_target.func.__annotations__:
+            kwargs['context']: ServicerContext = context
+        responses: list[Message] = await self.batch_target(**kwargs)
+        if len(responses) != len(requests):
+            raise RunTimeServerError(
+                details=f'Batch handler returned {len(responses)} responses for {len(requests)} requests'
+            )
+        return responses
+
+    async def join_item(
+        self: 'ServerBatchMethodGRPC',
+        request: Message,
+        context: ServicerContext,
+        batch: PendingBatch
+    ) -> ProtoMessage | Exception:
+        slot: BatchSlot = BatchSlot(batch=batch)
+        batch_slot.set(slot)
+        try:
+            response: Message | None = await self.wrapped_target(request=request, context=context)
+            if not response:
+                raise SendEmpty(text='Method did not return anything')
+            return self.encode_item(response=response)
+        except Exception as exc:
+            return exc
+        finally:
+            slot.leave()
+
+    async def call_batch_target(
+        self: 'ServerBatchMethodGRPC',
+        messages: Iterable[ProtoMessage],
+        context: ServicerContext
+    ) -> list[ProtoMessage | Exception]:
+        results: list[ProtoMessage | Exception | None] = []
+        requests: dict[int, Message] = {}
+        for index, message in enumerate(messages):
+            try:
+                requests[index] = self.server_method.to_pydantic(message=message, model=self.method.validation_request)
+                results.append(None)
+            except ValidationError as exc:
+                results.append(exc)
+        if not requests:
+            return results
+        if self.wrapped_target is None:
+            try:
+                responses: list[Message] = await self.run_batch_target(
+                    requests=list(requests.values()),
+                    context=context
+                )
+                for index, response in zip(requests, responses):
+                    results[index] = self.encode_item(response=response)
+            except Exception as exc:
+                for index in requests:
+                    results[index] = exc
+            return results
+        batch: PendingBatch = PendingBatch(size=len(requests))
+        items: Awaitable[list[ProtoMessage | Exception]] = gather(
+            *(self.join_item(request=request, context=context, batch=batch) for request in requests.values())
+        )
+        await batch.ready
+        if batch.requests:
+            try:
+                batch.resolve(results=await self.run_batch_target(requests=batch.requests, context=context))
+            except Exception as exc:
+                batch.resolve(results=exc)
+        for index, result in zip(requests, await items):
+            results[index] = result
+        return results
+
+    def to_batch(self: 'ServerBatchMethodGRPC', results: list[ProtoMessage | Exception]) -> ProtoMessage:
+        items: list[ProtoMessage] = []
+        statuses: list[ProtoMessage] = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                code, details, _ = exception_status(exc=result)
+                statuses.append(self.method.get_additional_proto(proto_name='BatchStatus')(
+                    index=index,  # noqa: index
+                    code=code.value[0],  # noqa: code
+                    details=str(details)  # noqa: details
+                ))
+                result: ProtoMessage = self.method.proto_response()
+            items.append(result)
+        return self.method.get_additional_proto(proto_name=self.method.batch_response.__name__)(
+            items=items,  # noqa: items
+            statuses=statuses  # noqa: statuses
+        )
+
+    async def call(self: 'ServerBatchMethodGRPC', message: ProtoMessage, context: ServicerContext) -> ProtoMessage:
+        set_deadline(time_remaining=context.time_remaining())
+        if self.batch_target is None:
+            results: list[ProtoMessage | Exception] = await gather(
+                *(self.call_item(message=item, context=context) for item in message.items)
+            )
+        else:
+            results: list[ProtoMessage | Exception] = await self.call_batch_target(
+                messages=message.items,
+                context=context
+            )
+        batch: ProtoMessage = self.to_batch(results=results)
+        if self.server_method.compression_enabled:
+            self.server_method.compress(context=context, size=batch.ByteSize())
+        return batch
+
+    async def __call__(self: 'ServerBatchMethodGRPC', message: ProtoMessage, context: ServicerContext) -> ProtoMessage:
+        # a batch handler runs once for the whole batch and takes one slot, single items take theirs in call_item
+        if self.batch_target is None or not self.server_method.limiters:
+            return await self.call(message=message, context=context)
+        started: float = await self.server_method.acquire(context=context)
+        try:
+            return await self.call(message=message, context=context)
+        finally:
+            self.server_method.release(started=started)
 
 
 class ClientMethodGRPC(MethodGRPC):
     def __init__(
         self: 'ClientMethodGRPC',
         method: Method,
-        service_name: str,
-        host: str,
-        port: int = 50051,
-        timeout_delay: Delay = 1
+        channel_pool: ChannelPool | LoadBalancer,
+        timeout_delay: Delay | None = 1,
+        cache: ResponseCache | None = None
     ):
         super().__init__(method=method)
         self.method: Method = method
-        self.service_name: str = service_name
-        self.host: str = host
-        self.port: int = port
-        self.timeout_delay: Delay = timeout_delay
+        self.channel_pool: ChannelPool | LoadBalancer = channel_pool
+        self.timeout_delay: Delay | None = timeout_delay
+        self.cache: ResponseCache | None = cache if self.method.cached else None
+        self.compression_threshold: int = (
+            self.method.compression_threshold if self.method.compression_threshold is not None
+            else DEFAULT_COMPRESSION_THRESHOLD
+        )
+        self.rpc_name: str = snake_to_camel(self.method.target.func.__name__)
+        self.batcher: RequestBatcher | None = None
+        if self.method.batched:
+            self.batcher: RequestBatcher = RequestBatcher(
+                send=self.call_batch,
+                max_size=self.method.batch_size,
+                max_delay=self.method.batch_delay
+            )
+        self.flights: SingleFlight | None = None
+        if self.method.single_flight:
+            self.flights: SingleFlight = SingleFlight(name=self.rpc_name)
+        self.hedging: HedgePolicy | None = None
+        if self.method.hedged:
+            self.hedging: HedgePolicy = HedgePolicy(
+                delay=self.method.hedge_delay,
+                percentile=self.method.hedge_percentile
+            )
 
     @property
-    def service(self: 'ClientMethodGRPC') -> Service:
-        return getattr(self.method.services, f'{self.service_name}')
+    def grpc_method(self: 'ClientMethodGRPC') -> MultiCallable:
+        return self.channel_pool.get_method(rpc_name=self.rpc_name)
 
-    @classmethod
-    async def call_grpc_method(cls: Type['ClientMethodGRPC'], method: MethodType, **kwargs) -> ProtoMessage:
-        with catch_warnings(action='ignore', category=experimental.ExperimentalApiWarning):
-            return await to_thread(method, **kwargs)
-
-    async def default_call(self: 'ClientMethodGRPC', grpc_method: Callable, request: Message) -> Message | None:
-        proto_request: ProtoMessage = self.pydantic_to_proto(
-            message=request,
-            model=self.method.proto_request,
-            method=self.method
+    @property
+    def timeout(self: 'ClientMethodGRPC') -> Delay | None:
+        return get_timeout(timeout=self.timeout_delay)
+
+    @property
+    def stream_compression(self: 'ClientMethodGRPC') -> Compression | None:
+        if self.method.compression is None:
+            return None
+        return grpc_compression(compression=self.method.compression)
+
+    def get_compression(self: 'ClientMethodGRPC', message: ProtoMessage) -> Compression | None:
+        if self.method.compression is None:
+            return None
+        return select_compression(self.method.compression, self.compression_threshold, message.ByteSize())
+
+    def to_proto_request(
+        self: 'ClientMethodGRPC',
+        request: Message | AsyncIterable[Message]
+    ) -> ProtoMessage | AsyncIterator[ProtoMessage]:
+        if self.method.request_streaming:
+            return self.to_proto_stream(messages=request, model=self.method.validation_request)
+        return self.to_proto(message=request, model=self.method.validation_request)
+
+    async def call(self: 'ClientMethodGRPC', request: Message | AsyncIterable[Message]) -> Message | None:
+        proto_response: ProtoMessage = await self.grpc_method(
+            self.to_proto_request(request=request),
+            timeout=self.timeout,
+            compression=self.stream_compression
         )
-        proto_response: ProtoMessage = await self.call_grpc_method(
-            method=grpc_method,
-            request=proto_request,
-            target=f'{self.host}:{self.port}',
-            insecure=True,
-            timeout=self.timeout_delay
+        return self.to_pydantic(message=proto_response, model=self.method.validation_response)
+
+    async def call_batch(self: 'ClientMethodGRPC', requests: list[ProtoMessage]) -> list[ProtoMessage | Exception]:
+        batch_type: Type[ProtoMessage] = self.method.get_additional_proto(proto_name=self.method.batch_request.__name__)
+        batch: ProtoMessage = batch_type(items=requests)  # noqa: items
+        proto_response: ProtoMessage = await self.channel_pool.unary(
+            rpc_name=f'{self.rpc_name}Batch',
+            request=batch,
+            timeout=self.timeout,
+            compression=self.get_compression(message=batch)
         )
-        return self.proto_to_pydantic(message=proto_response, model=self.method.response, method=self.method)
+        errors: dict[int, BatchItemError] = {
+            status.index: BatchItemError(
+                status_code=STATUS_CODES.get(status.code, StatusCode.UNKNOWN),
+                details=status.details
+            )
+            for status in proto_response.statuses
+        }
+        return [errors.get(index, item) for index, item in enumerate(proto_response.items)]
 
-    async def bytes_call(self: 'ClientMethodGRPC', grpc_method: Callable, request: Message) -> Message | None:
-        proto_request: ProtoMessage = self.pydantic_to_bytes(message=request, method=self.method)
-        proto_response: ProtoMessage = await self.call_grpc_method(
-            method=grpc_method,
+    async def send_chunked(self: 'ClientMethodGRPC', proto_request: ProtoMessage) -> ProtoMessage:
+        call: StreamStreamCall = self.grpc_method(
+            self.to_chunks(message=proto_request),
+            timeout=self.timeout,
+            compression=self.get_compression(message=proto_request)
+        )
+        try:
+            return await self.from_chunks(chunks=call, proto=self.method.proto_response)
+        finally:
+            call.cancel()
+
+    async def send_unary(self: 'ClientMethodGRPC', proto_request: ProtoMessage) -> ProtoMessage:
+        if self.method.chunked:
+            return await self.send_chunked(proto_request=proto_request)
+        if self.method.batched:
+            return await self.batcher.submit(request=proto_request)
+        if self.hedging is None:
+            return await self.channel_pool.unary(
+                rpc_name=self.rpc_name,
+                request=proto_request,
+                timeout=self.timeout,
+                compression=self.get_compression(message=proto_request)
+            )
+        return await self.hedging.call(attempt=partial(
+            self.channel_pool.unary,
+            rpc_name=self.rpc_name,
             request=proto_request,
-            target=f'{self.host}:{self.port}',
-            insecure=True,
-            timeout=self.timeout_delay
+            timeout=self.timeout,
+            compression=self.get_compression(message=proto_request)
+        ))
+
+    async def fetch(self: 'ClientMethodGRPC', proto_request: ProtoMessage, cache_key: bytes | None = None) -> Message:
+        proto_response: ProtoMessage = await self.send_unary(proto_request=proto_request)
+        response: Message = self.to_pydantic(message=proto_response, model=self.method.validation_response)
+        if cache_key is not None:
+            self.cache.set(
+                key=cache_key,
+                value=proto_response if self.cache.encoded else response.model_copy(deep=True),
+                size=proto_response.ByteSize(),
+                ttl=self.method.cache_ttl
+            )
+        return response
+
+    async def call_unary(self: 'ClientMethodGRPC', request: Message) -> Message:
+        proto_request: ProtoMessage = self.to_proto(message=request, model=self.method.validation_request)
+        if self.flights is None and self.cache is None:
+            return await self.fetch(proto_request=proto_request)
+        data: bytes = proto_request.SerializeToString(deterministic=True)
+        cache_key: bytes | None = None
+        if self.cache is not None:
+            cache_key: bytes = request_digest(name=self.method.target.func.__qualname__, data=data)
+            if (cached := self.cache.get(key=cache_key)) is not None:
+                if self.cache.encoded:
+                    return self.to_pydantic(message=cached, model=self.method.validation_response)
+                # every caller gets its own response, so changing it does not change the cached one
+                return cached.model_copy(deep=True)
+        if self.flights is None:
+            return await self.fetch(proto_request=proto_request, cache_key=cache_key)
+        return await self.flights.do(
+            data=data,
+            call=partial(self.fetch, proto_request=proto_request, cache_key=cache_key)
         )
-        return self.bytes_to_pydantic(message=proto_response, model=self.method.validation_response)
 
-    async def __call__(self: 'ClientMethodGRPC', request: Message) -> Message | None:
-        grpc_method: Callable = getattr(self.service, snake_to_camel(self.method.target.func.__name__))
-        match self.method.mode:
-            case ServiceModes.DEFAULT:
-                return await self.default_call(grpc_method=grpc_method, request=request)
-            case ServiceModes.BYTES:
-                return await self.bytes_call(grpc_method=grpc_method, request=request)
-            case _:
-                return assert_never(self.method.mode)
+    async def call_stream(
+        self: 'ClientMethodGRPC',
+        request: Message | AsyncIterable[Message]
+    ) -> AsyncIterator[Message]:
+        call: UnaryStreamCall | StreamStreamCall = self.grpc_method(
+            self.to_proto_request(request=request),
+            timeout=self.timeout,
+            compression=self.stream_compression
+        )
+        try:
+            async for message in self.to_pydantic_stream(messages=call, model=self.method.validation_response):
+                yield message
+        finally:
+            call.cancel()
+
+    def __call__(
+        self: 'ClientMethodGRPC',
+        request: Message | AsyncIterable[Message]
+    ) -> Awaitable[Message | None] | AsyncIterator[Message]:
+        if self.method.response_streaming:
+            return self.call_stream(request=request)
+        if self.method.request_streaming:
+            return self.call(request=request)
+        return self.call_unary(request=request)
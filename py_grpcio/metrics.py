@@ -0,0 +1,127 @@
+from math import inf
+from bisect import bisect_left
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from collections import defaultdict
+
+from grpc import StatusCode
+
+from py_grpcio.enums import Stages
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+
+handler_time: ContextVar[float] = ContextVar('handler_time', default=0.0)
+
+
+class Histogram:
+    def __init__(self: 'Histogram', buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets: tuple[float, ...] = (*buckets, inf)
+        self.counts: list[int] = [0] * len(self.buckets)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self: 'Histogram', value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self: 'Histogram', q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank: float = q * self.count
+        seen: int = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower: float = self.buckets[index - 1] if index else 0.0
+                upper: float = self.buckets[index] if index < len(self.buckets) - 1 else lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-2]
+
+    def cumulative(self: 'Histogram') -> list[tuple[float, int]]:
+        total: int = 0
+        result: list[tuple[float, int]] = []
+        for bucket, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bucket, total))
+        return result
+
+
+class BaseMetricsExporter(ABC):
+    @abstractmethod
+    def observe(self: 'BaseMetricsExporter', method: str, stage: Stages, seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    def track_in_flight(self: 'BaseMetricsExporter', method: str, delta: int) -> None:
+        ...
+
+    @abstractmethod
+    def count_status(self: 'BaseMetricsExporter', method: str, code: StatusCode) -> None:
+        ...
+
+
+class InMemoryExporter(BaseMetricsExporter):
+    def __init__(self: 'InMemoryExporter', buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets: tuple[float, ...] = buckets
+        self.histograms: dict[tuple[str, Stages], Histogram] = {}
+        self.in_flight: defaultdict[str, int] = defaultdict(int)
+        self.statuses: defaultdict[tuple[str, str], int] = defaultdict(int)
+
+    def observe(self: 'InMemoryExporter', method: str, stage: Stages, seconds: float) -> None:
+        if (histogram := self.histograms.get((method, stage))) is None:
+            histogram: Histogram = Histogram(buckets=self.buckets)
+            self.histograms[(method, stage)] = histogram
+        histogram.observe(value=seconds)
+
+    def track_in_flight(self: 'InMemoryExporter', method: str, delta: int) -> None:
+        self.in_flight[method] += delta
+
+    def count_status(self: 'InMemoryExporter', method: str, code: StatusCode) -> None:
+        self.statuses[(method, code.name)] += 1
+
+    def snapshot(self: 'InMemoryExporter') -> dict[str, dict]:
+        snapshot: defaultdict[str, dict] = defaultdict(lambda: {'in_flight': 0, 'statuses': {}, 'stages': {}})
+        for (method, stage), histogram in self.histograms.items():
+            snapshot[method]['stages'][stage.value] = {
+                'count': histogram.count,
+                'mean': histogram.sum / histogram.count,
+                'p50': histogram.quantile(q=0.5),
+                'p90': histogram.quantile(q=0.9),
+                'p99': histogram.quantile(q=0.99),
+            }
+        for method, in_flight in self.in_flight.items():
+            snapshot[method]['in_flight'] = in_flight
+        for (method, code), count in self.statuses.items():
+            snapshot[method]['statuses'][code] = count
+        return dict(snapshot)
+
+
+class PrometheusExporter(InMemoryExporter):
+    def __init__(self: 'PrometheusExporter', prefix: str = 'py_grpcio', buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(buckets=buckets)
+        self.prefix: str = prefix
+
+    def render(self: 'PrometheusExporter') -> str:
+        stage_seconds: str = f'{self.prefix}_stage_seconds'
+        lines: list[str] = [
+            f'# HELP {stage_seconds} Time spent in every stage of a request.',
+            f'# TYPE {stage_seconds} histogram',
+        ]
+        for (method, stage), histogram in self.histograms.items():
+            labels: str = f'method="{method}",stage="{stage.value}"'
+            for bucket, count in histogram.cumulative():
+                lines.append(f'{stage_seconds}_bucket{{{labels},le="{"+Inf" if bucket == inf else bucket}"}} {count}')
+            lines.append(f'{stage_seconds}_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'{stage_seconds}_count{{{labels}}} {histogram.count}')
+        in_flight: str = f'{self.prefix}_in_flight'
+        lines.extend((f'# HELP {in_flight} Requests being handled.', f'# TYPE {in_flight} gauge'))
+        lines.extend(f'{in_flight}{{method="{method}"}} {value}' for method, value in self.in_flight.items())
+        responses: str = f'{self.prefix}_responses_total'
+        lines.extend((f'# HELP {responses} Finished requests by status code.', f'# TYPE {responses} counter'))
+        lines.extend(
+            f'{responses}{{method="{method}",code="{code}"}} {value}' for (method, code), value in self.statuses.items()
+        )
+        return '\n'.join(lines) + '\n'
@@ -1,5 +1,6 @@
 from typing import Union, Any
 from abc import abstractmethod
+from inspect import isawaitable
 
 from grpc.aio import ServicerContext
 
@@ -21,7 +22,8 @@ class BaseMiddleware:
         return kwargs
 
     async def call_target(self, request: Message, context: ServicerContext) -> Message:
-        return await self.target(**self.get_kwargs(request=request, context=context))
+        response: Any = self.target(**self.get_kwargs(request=request, context=context))
+        return await response if isawaitable(response) else response
 
     @abstractmethod
     async def __call__(self: 'BaseMiddleware', request: Message, context: ServicerContext) -> Message:
@@ -1,8 +1,9 @@
-from inspect import isclass
-from functools import partial
+from inspect import isclass, iscoroutinefunction, isasyncgenfunction
+from functools import partial, cache
 from typing_extensions import Annotated
-from types import FunctionType, ModuleType, GenericAlias
-from typing import Type, Any, Iterable, get_origin, assert_never
+from types import FunctionType, ModuleType, UnionType
+from collections.abc import AsyncIterator, AsyncIterable, AsyncGenerator
+from typing import Type, Any, Iterable, Union, get_origin, get_args, assert_never
 
 from pydantic import BaseModel, ConfigDict, Field as PyField, create_model
 from pydantic.fields import FieldInfo  # noqa: FieldInfo
@@ -10,12 +11,18 @@ from pydantic_core.core_schema import CoreSchema, no_info_wrap_validator_functio
 
 from google.protobuf.message import Message as ProtoMessage
 
-from py_grpcio.enums import ServiceModes
+from py_grpcio.enums import ServiceModes, Executors, Compressions
+from py_grpcio.codec import BaseCodec, JsonCodec
 from py_grpcio.exceptions import MethodSignatureException
-from py_grpcio.proto import ProtoBufTypes, parse_field_type
+from py_grpcio.decorators import get_method_options
+from py_grpcio.blob import get_blob_fields
+from py_grpcio.ndarray import is_ndarray
+from py_grpcio.proto import ProtoBufTypes, parse_field_type, get_field_type
 
 type Target = partial
 
+STREAM_TYPES: tuple[type, ...] = (AsyncIterator, AsyncIterable, AsyncGenerator)
+
 
 class Field(BaseModel):
     name: str
@@ -26,7 +33,7 @@ class Field(BaseModel):
 
     @classmethod
     def from_field_info(cls: Type['Field'], field_name: str, field_info: FieldInfo) -> 'Field':
-        return cls(**parse_field_type(field_name=field_name, field_type=field_info.annotation))
+        return cls(**parse_field_type(field_name=field_name, field_type=get_field_type(field_info=field_info)))
 
 
 class Message(BaseModel):
@@ -43,27 +50,78 @@ class Message(BaseModel):
     ) -> dict[str, Type['Message']]:
         messages: dict[str, Type[Message]] = {}
         for field_name, field_info in (cls.model_fields if model_fields is None else model_fields).items():
-            field_type: type | None = field_info.annotation
-            if isclass(field_type) and issubclass(field_type, Message):
-                messages[field_type.__name__]: Type[Message] = field_type
-                if additional_messages := cls.get_additional_messages(model_fields=field_type.__pydantic_fields__):
-                    messages.update(**additional_messages)
-            elif isinstance(field_type, GenericAlias) and (origin := get_origin(tp=field_type)) is not None:
-                if issubclass(origin, Iterable):
-                    if len(args := field_type.__args__) != 1:
-                        raise TypeError(
-                            f'Field `{field_name}`: type `{field_type}` must have only one subtype, not {len(args)}.'
-                        )
-                    if isclass(sub_field_type := args[0]) and issubclass(sub_field_type, Message):
-                        messages[sub_field_type.__name__]: Type[Message] = sub_field_type
-                        if additional_messages := cls.get_additional_messages(
-                            model_fields=sub_field_type.__pydantic_fields__
-                        ):
-                            messages.update(**additional_messages)
+            for message in cls.get_message_types(field_name=field_name, field_type=field_info.annotation):
+                if message.__name__ not in messages:
+                    messages[message.__name__]: Type[Message] = message
+                    messages.update(**cls.get_additional_messages(model_fields=message.__pydantic_fields__))
         return messages
 
+    @classmethod
+    def get_message_types(cls, field_name: str, field_type: Any) -> list[Type['Message']]:
+        if isclass(field_type) and issubclass(field_type, Message):
+            return [field_type]
+        if is_ndarray(annotation=field_type) and field_type.dtype is None:
+            return [NDArrayMessage]
+        if (origin := get_origin(field_type)) is None:
+            return []
+        args: tuple[Any, ...] = get_args(field_type)
+        if origin is Annotated:
+            return cls.get_message_types(field_name=field_name, field_type=args[0])
+        if origin in (Union, UnionType):
+            return [
+                message for arg in args for message in cls.get_message_types(field_name=field_name, field_type=arg)
+            ]
+        if isclass(origin) and issubclass(origin, dict):
+            if len(args) != 2:
+                raise TypeError(f'Field `{field_name}`: type `{field_type}` must have two subtypes, not {len(args)}')
+            return cls.get_message_types(field_name=field_name, field_type=args[1])
+        if isclass(origin) and issubclass(origin, Iterable):
+            if len(args) != 1:
+                raise TypeError(
+                    f'Field `{field_name}`: type `{field_type}` must have only one subtype, not {len(args)}.'
+                )
+            return cls.get_message_types(field_name=field_name, field_type=args[0])
+        return []
+
+
+BytesMessage: Type['BytesMessage'] = create_model(
+    'BytesMessage',
+    bytes=(bytes, ...),
+    blobs=(dict[str, bytes], {}),
+    __base__=Message
+)
+
+
+class BatchStatus(Message):
+    index: Annotated[int, ProtoBufTypes.INT32]
+    code: Annotated[int, ProtoBufTypes.INT32]
+    details: str = ''
 
-BytesMessage: Type['BytesMessage'] = create_model('BytesMessage', bytes=(bytes, ...), __base__=Message)
+
+@cache
+def batch_model(model: Type[Message]) -> Type[Message]:
+    return create_model(
+        f'Batch{model.__name__}',
+        items=(list[model], []),
+        statuses=(list[BatchStatus], []),
+        __base__=Message
+    )
+
+
+NDArrayMessage: Type['NDArrayMessage'] = create_model(
+    'NDArrayMessage',
+    data=(bytes, ...),
+    dtype=(str, ...),
+    shape=(list[int], []),
+    __base__=Message
+)
+
+ChunkMessage: Type['ChunkMessage'] = create_model(
+    'ChunkMessage',
+    data=(bytes, ...),
+    size=(int, 0),
+    __base__=Message
+)
 
 
 class ModuleTypePydanticAnnotation:
@@ -82,8 +140,38 @@ class ModuleTypePydanticAnnotation:
         )
 
 
+def parse_stream(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) in STREAM_TYPES:
+        return get_args(annotation)[0], True
+    return annotation, False
+
+
+def is_message_type(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, Message)
+
+
 class Method(BaseModel):
     mode: ServiceModes
+    codec: BaseCodec = PyField(default_factory=JsonCodec)
+    executor: Executors = Executors.LOOP
+    max_concurrency: int | None = None
+    max_queue: int = 0
+    chunk_size: int | None = None
+    max_payload_size: int | None = None
+    batch_size: int | None = None
+    batch_delay: float = 0
+    batch_target: Target | None = None
+    batch_executor: Executors = Executors.LOOP
+    single_flight: bool = False
+    cache_ttl: float | None = None
+    cache_skip_middlewares: bool = False
+    timeout: float | None = None
+    hedge_delay: float | None = None
+    hedge_percentile: float | None = None
+    compression: Compressions | None = None
+    compression_threshold: int | None = None
+    request_streaming: bool = False
+    response_streaming: bool = False
     request: Type[Message]
     response: Type[Message]
     validation_request: Type[Message]
@@ -92,22 +180,94 @@ class Method(BaseModel):
     protos: Annotated[ModuleType, ModuleTypePydanticAnnotation] | None = None
     services: Annotated[ModuleType, ModuleTypePydanticAnnotation] | None = None
     additional_messages: dict[str, Type[Message]] = PyField(default_factory=dict)
+    converters: dict[str, Any] = PyField(default_factory=dict)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @classmethod
-    def from_target(cls, target: FunctionType, mode: ServiceModes = ServiceModes.DEFAULT) -> 'Method':
+    def from_target(
+        cls,
+        target: FunctionType,
+        mode: ServiceModes = ServiceModes.DEFAULT,
+        codec: BaseCodec | None = None,
+        executor: Executors | None = None,
+        compression: Compressions | None = None,
+        compression_threshold: int | None = None
+    ) -> 'Method':
         annotations: dict[str, Any] = target.__annotations__
-        if not (requst_message := annotations.get('request')) or not issubclass(requst_message, Message):
+        options: dict[str, Any] = get_method_options(func=target)
+        requst_message, request_streaming = parse_stream(annotation=annotations.get('request'))
+        if not is_message_type(annotation=requst_message):
+            raise MethodSignatureException(
+                text=f'Method `{target.__qualname__}` must receive a request parameter of type subclass `Message` '
+                     'or `AsyncIterator[Message]`'
+            )
+        response_message, response_streaming = parse_stream(annotation=annotations.get('return'))
+        if not is_message_type(annotation=response_message):
+            raise MethodSignatureException(
+                text=f'The `{target.__qualname__}` method should return an object of type subclass `Message` '
+                     'or `AsyncIterator[Message]`'
+            )
+        if options.get('chunk_size') is not None and (request_streaming or response_streaming):
+            raise MethodSignatureException(
+                text=f'Streaming method `{target.__qualname__}` can not be chunked'
+            )
+        if options.get('batch_size') is not None and (
+            request_streaming or response_streaming or options.get('chunk_size') is not None
+        ):
+            raise MethodSignatureException(
+                text=f'Streaming or chunked method `{target.__qualname__}` can not be batched'
+            )
+        if options.get('single_flight') and (request_streaming or response_streaming):
+            raise MethodSignatureException(
+                text=f'Streaming method `{target.__qualname__}` can not be single-flight'
+            )
+        if options.get('hedge_percentile') is not None and (
+            request_streaming or response_streaming
+            or options.get('chunk_size') is not None or options.get('batch_size') is not None
+        ):
             raise MethodSignatureException(
-                text=f'Method `{target.__qualname__}` must receive a request parameter of type subclass `Message`'
+                text=f'Streaming, chunked or batched method `{target.__qualname__}` can not be hedged'
             )
-        if not (response_message := annotations.get('return')) or not issubclass(response_message, Message):
+        if options.get('cache_ttl') is not None and (request_streaming or response_streaming):
             raise MethodSignatureException(
-                text=f'The `{target.__qualname__}` method should return an object of type subclass `Message`'
+                text=f'Streaming method `{target.__qualname__}` can not be cached'
             )
+        if mode is ServiceModes.BYTES:
+            for message in (requst_message, response_message):
+                for nested in message.get_additional_messages().values():
+                    if get_blob_fields(model=nested):
+                        raise MethodSignatureException(
+                            text=f'Method `{target.__qualname__}`: blob fields of nested message `{nested.__name__}` '
+                                 f'are not supported in `{mode}` mode'
+                        )
         return cls(
             mode=mode,
+            codec=codec or JsonCodec(),
+            executor=cls.parse_executor(
+                target=target,
+                executor=options.get('executor'),
+                default=executor,
+                streaming=request_streaming or response_streaming
+            ),
+            max_concurrency=options.get('max_concurrency'),
+            max_queue=options.get('max_queue', 0),
+            chunk_size=options.get('chunk_size'),
+            max_payload_size=options.get('max_payload_size'),
+            batch_size=options.get('batch_size'),
+            batch_delay=options.get('batch_delay', 0),
+            single_flight=options.get('single_flight', False),
+            cache_ttl=options.get('cache_ttl'),
+            cache_skip_middlewares=options.get('cache_skip_middlewares', False),
+            timeout=options.get('timeout'),
+            hedge_delay=options.get('hedge_delay'),
+            hedge_percentile=options.get('hedge_percentile'),
+            compression=options.get('compression', compression),
+            compression_threshold=(
+                threshold if (threshold := options.get('compression_threshold')) is not None else compression_threshold
+            ),
+            request_streaming=request_streaming,
+            response_streaming=response_streaming,
             target=partial(target, self=target.__class__),
             request=BytesMessage if mode is ServiceModes.BYTES else requst_message,
             response=BytesMessage if mode is ServiceModes.BYTES else response_message,
@@ -115,6 +275,29 @@ class Method(BaseModel):
             validation_response=response_message
         )
 
+    @classmethod
+    def parse_executor(
+        cls,
+        target: FunctionType,
+        executor: Executors | None,
+        default: Executors | None,
+        streaming: bool
+    ) -> Executors:
+        if iscoroutinefunction(target) or isasyncgenfunction(target):
+            if executor not in (None, Executors.LOOP):
+                raise MethodSignatureException(
+                    text=f'Method `{target.__qualname__}` must be a plain function to run in `{executor}` executor'
+                )
+            return Executors.LOOP
+        if streaming:
+            raise MethodSignatureException(text=f'Streaming method `{target.__qualname__}` must be a coroutine')
+        executor: Executors = executor or default or Executors.THREAD
+        if executor is Executors.PROCESS and 'context' in target.__annotations__:
+            raise MethodSignatureException(
+                text=f'Method `{target.__qualname__}` runs in `process` executor and can not receive a context'
+            )
+        return executor
+
     @property
     def default_messages(self: 'Method') -> dict[str, Type[Message]]:
         self.additional_messages.update(self.request.get_additional_messages())
@@ -130,7 +313,11 @@ class Method(BaseModel):
         return {'BytesMessage': BytesMessage}
 
     @property
-    def messages(self: 'Method') -> dict[str, Type[Message]]:
+    def chunked(self: 'Method') -> bool:
+        return self.chunk_size is not None
+
+    @property
+    def mode_messages(self: 'Method') -> dict[str, Type[Message]]:
         match self.mode:
             case ServiceModes.DEFAULT:
                 return self.default_messages
@@ -139,6 +326,43 @@ class Method(BaseModel):
             case _:
                 return assert_never(self.mode)
 
+    @property
+    def streaming(self: 'Method') -> bool:
+        return self.request_streaming or self.response_streaming
+
+    @property
+    def hedged(self: 'Method') -> bool:
+        return self.hedge_percentile is not None
+
+    @property
+    def cached(self: 'Method') -> bool:
+        return self.cache_ttl is not None
+
+    @property
+    def batched(self: 'Method') -> bool:
+        return self.batch_size is not None
+
+    @property
+    def batch_request(self: 'Method') -> Type[Message]:
+        return batch_model(model=self.request)
+
+    @property
+    def batch_response(self: 'Method') -> Type[Message]:
+        return batch_model(model=self.response)
+
+    @property
+    def messages(self: 'Method') -> dict[str, Type[Message]]:
+        if self.chunked:
+            return {**self.mode_messages, 'ChunkMessage': ChunkMessage}
+        if self.batched:
+            return {
+                **self.mode_messages,
+                'BatchStatus': BatchStatus,
+                self.batch_request.__name__: self.batch_request,
+                self.batch_response.__name__: self.batch_response,
+            }
+        return self.mode_messages
+
     @property
     def proto_request(self: 'Method') -> Type[ProtoMessage] | None:
         return getattr(self.protos, self.request.__name__)
@@ -152,3 +376,6 @@ class Method(BaseModel):
 
     def get_additional_message(self: 'Method', message_name: str) -> Type[Message] | None:
         return self.additional_messages.get(message_name)
+
+    def get_converter(self: 'Method', message_name: str) -> Any:
+        return self.converters[message_name]
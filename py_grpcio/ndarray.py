@@ -0,0 +1,109 @@
+import sys
+
+from functools import cache
+from base64 import b64encode, b64decode
+from inspect import isclass
+from types import ModuleType
+from typing import Any, Type
+
+from pydantic_core.core_schema import (
+    CoreSchema, SerializationInfo, no_info_plain_validator_function, plain_serializer_function_ser_schema
+)
+
+PACKED_DTYPES: tuple[str, ...] = ('float64', 'float32', 'int64', 'int32', 'uint64', 'uint32', 'bool')
+
+
+@cache
+def import_numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError('NDArray fields require `numpy`: pip install py-grpcio[numpy]') from exc
+    return numpy
+
+
+class NDArray:
+    dtype: str | None = None
+
+    def __class_getitem__(cls: Type['NDArray'], dtype: Any) -> Type['NDArray']:
+        return packed_array(dtype=import_numpy().dtype(dtype).name)
+
+    @classmethod
+    def validate(cls: Type['NDArray'], value: Any) -> Any:
+        if isinstance(value, dict):
+            try:
+                value: Any = envelope_to_ndarray(data=value['data'], dtype=value['dtype'], shape=value['shape'])
+            except (KeyError, TypeError) as exc:
+                raise ValueError(f'NDArray envelope must have data, dtype and shape: {exc}')
+        array: Any = import_numpy().asarray(value, dtype=cls.dtype)
+        if cls.dtype is not None and array.ndim != 1:
+            raise ValueError(f'NDArray[{cls.dtype}] must be one-dimensional, not {array.ndim}-dimensional')
+        if array.dtype.hasobject:
+            raise ValueError('NDArray can not hold python objects')
+        return array
+
+    @classmethod
+    def serialize(cls: Type['NDArray'], value: Any, info: SerializationInfo) -> Any:
+        return ndarray_to_json(value=value) if info.mode == 'json' else value
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls: Type['NDArray'], source_type: Any, _) -> CoreSchema:
+        return no_info_plain_validator_function(
+            cls.validate,
+            serialization=plain_serializer_function_ser_schema(cls.serialize, info_arg=True)
+        )
+
+
+@cache
+def packed_array(dtype: str) -> Type[NDArray]:
+    if dtype not in PACKED_DTYPES:
+        raise TypeError(f'NDArray dtype must be one of {", ".join(PACKED_DTYPES)}, not `{dtype}`')
+    return type(f'NDArray[{dtype}]', (NDArray,), {'dtype': dtype})
+
+
+def is_ndarray(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, NDArray)
+
+
+def is_ndarray_value(value: Any) -> bool:
+    return (numpy := sys.modules.get('numpy')) is not None and isinstance(value, numpy.ndarray)
+
+
+def varint(value: int) -> bytes:
+    buffer: bytearray = bytearray()
+    while value > 0x7f:
+        buffer.append(value & 0x7f | 0x80)
+        value >>= 7
+    buffer.append(value)
+    return bytes(buffer)
+
+
+def packed_field(field_number: int, dtype: str) -> tuple[bytes, Any]:
+    return varint(value=field_number << 3 | 2), import_numpy().dtype(dtype).newbyteorder('<')
+
+
+def encode_packed(tag: bytes, dtype: Any, value: Any) -> bytes:
+    data: bytes = value.astype(dtype, copy=False).tobytes()
+    return b''.join((tag, varint(value=len(data)), data)) if data else b''
+
+
+def decode_packed(dtype: str, values: Any) -> Any:
+    return import_numpy().array(values, dtype=dtype)
+
+
+def ndarray_to_envelope(value: Any) -> dict[str, Any]:
+    return {'data': value.tobytes(), 'dtype': value.dtype.str, 'shape': value.shape}
+
+
+def ndarray_to_json(value: Any) -> dict[str, Any]:
+    return {'data': b64encode(value.tobytes()).decode(), 'dtype': value.dtype.str, 'shape': list(value.shape)}
+
+
+def envelope_to_ndarray(data: bytes | str, dtype: str, shape: Any) -> Any:
+    if isinstance(data, str):
+        data: bytes = b64decode(data)
+    return import_numpy().frombuffer(data, dtype=dtype).reshape(tuple(shape))
+
+
+def decode_envelope(message: Any) -> Any:
+    return envelope_to_ndarray(data=message.data, dtype=message.dtype, shape=message.shape)
@@ -0,0 +1,144 @@
+from typing import Any, Type, assert_never
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from py_grpcio.enums import Presets
+
+type ChannelOption = tuple[str, Any]
+
+MiB: int = 1024 * 1024
+
+UNLIMITED: int = -1
+LARGE_MESSAGE_LENGTH: int = 64 * MiB
+HTTP2_MAX_FRAME_SIZE: int = 16 * MiB - 1
+
+
+class BaseOptions(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    max_receive_message_length: int | None = Field(
+        default=None,
+        ge=UNLIMITED,
+        serialization_alias='grpc.max_receive_message_length'
+    )
+    max_send_message_length: int | None = Field(
+        default=None,
+        ge=UNLIMITED,
+        serialization_alias='grpc.max_send_message_length'
+    )
+    keepalive_time_ms: int | None = Field(default=None, gt=0, serialization_alias='grpc.keepalive_time_ms')
+    keepalive_timeout_ms: int | None = Field(default=None, gt=0, serialization_alias='grpc.keepalive_timeout_ms')
+    keepalive_permit_without_calls: bool | None = Field(
+        default=None,
+        serialization_alias='grpc.keepalive_permit_without_calls'
+    )
+    max_pings_without_data: int | None = Field(
+        default=None,
+        ge=0,
+        serialization_alias='grpc.http2.max_pings_without_data'
+    )
+    bdp_probe: bool | None = Field(default=None, serialization_alias='grpc.http2.bdp_probe')
+    stream_window_size: int | None = Field(default=None, gt=0, serialization_alias='grpc.http2.lookahead_bytes')
+    max_frame_size: int | None = Field(
+        default=None,
+        ge=16 * 1024,
+        le=HTTP2_MAX_FRAME_SIZE,
+        serialization_alias='grpc.http2.max_frame_size'
+    )
+    extra: dict[str, int | str] = Field(default_factory=dict, exclude=True)
+
+    def to_grpc(self: 'BaseOptions') -> list[ChannelOption]:
+        options: dict[str, Any] = self.model_dump(by_alias=True, exclude_none=True)
+        options.update(self.extra)
+        return [(name, int(value) if isinstance(value, bool) else value) for name, value in options.items()]
+
+
+class ServerOptions(BaseOptions):
+    max_concurrent_streams: int | None = Field(default=None, gt=0, serialization_alias='grpc.max_concurrent_streams')
+    min_ping_interval_without_data_ms: int | None = Field(
+        default=None,
+        ge=0,
+        serialization_alias='grpc.http2.min_ping_interval_without_data_ms'
+    )
+    max_ping_strikes: int | None = Field(default=None, ge=0, serialization_alias='grpc.http2.max_ping_strikes')
+    max_connection_idle_ms: int | None = Field(default=None, gt=0, serialization_alias='grpc.max_connection_idle_ms')
+    max_connection_age_ms: int | None = Field(default=None, gt=0, serialization_alias='grpc.max_connection_age_ms')
+    max_connection_age_grace_ms: int | None = Field(
+        default=None,
+        gt=0,
+        serialization_alias='grpc.max_connection_age_grace_ms'
+    )
+
+    @classmethod
+    def preset(cls: Type['ServerOptions'], preset: Presets) -> 'ServerOptions':
+        match preset:
+            case Presets.LOW_LATENCY:
+                return cls(
+                    keepalive_time_ms=10_000,
+                    keepalive_timeout_ms=5_000,
+                    keepalive_permit_without_calls=True,
+                    max_pings_without_data=0,
+                    min_ping_interval_without_data_ms=5_000,
+                    max_ping_strikes=0
+                )
+            case Presets.HIGH_THROUGHPUT:
+                return cls(
+                    keepalive_time_ms=60_000,
+                    keepalive_timeout_ms=20_000,
+                    bdp_probe=True,
+                    stream_window_size=4 * MiB
+                )
+            case Presets.LARGE_MESSAGE:
+                return cls(
+                    max_receive_message_length=LARGE_MESSAGE_LENGTH,
+                    max_send_message_length=LARGE_MESSAGE_LENGTH,
+                    bdp_probe=True,
+                    stream_window_size=16 * MiB,
+                    max_frame_size=HTTP2_MAX_FRAME_SIZE
+                )
+            case _:
+                return assert_never(preset)
+
+
+class ChannelOptions(BaseOptions):
+    initial_reconnect_backoff_ms: int | None = Field(
+        default=None,
+        gt=0,
+        serialization_alias='grpc.initial_reconnect_backoff_ms'
+    )
+    max_reconnect_backoff_ms: int | None = Field(
+        default=None,
+        gt=0,
+        serialization_alias='grpc.max_reconnect_backoff_ms'
+    )
+    enable_retries: bool | None = Field(default=None, serialization_alias='grpc.enable_retries')
+
+    @classmethod
+    def preset(cls: Type['ChannelOptions'], preset: Presets) -> 'ChannelOptions':
+        match preset:
+            case Presets.LOW_LATENCY:
+                return cls(
+                    keepalive_time_ms=10_000,
+                    keepalive_timeout_ms=5_000,
+                    keepalive_permit_without_calls=True,
+                    max_pings_without_data=0,
+                    initial_reconnect_backoff_ms=100,
+                    max_reconnect_backoff_ms=2_000
+                )
+            case Presets.HIGH_THROUGHPUT:
+                return cls(
+                    keepalive_time_ms=60_000,
+                    keepalive_timeout_ms=20_000,
+                    bdp_probe=True,
+                    stream_window_size=4 * MiB
+                )
+            case Presets.LARGE_MESSAGE:
+                return cls(
+                    max_receive_message_length=LARGE_MESSAGE_LENGTH,
+                    max_send_message_length=LARGE_MESSAGE_LENGTH,
+                    bdp_probe=True,
+                    stream_window_size=16 * MiB,
+                    max_frame_size=HTTP2_MAX_FRAME_SIZE
+                )
+            case _:
+                return assert_never(preset)
@@ -1,2 +1,3 @@
 from py_grpcio.proto.enums import ProtoBufTypes
-from py_grpcio.proto.parser import TYPE_MAPPING, parse_field_type
+from py_grpcio.proto.parser import TYPE_MAPPING, PROTO_IMPORTS, parse_field_type, get_field_type, get_proto_type
+from py_grpcio.proto.compiler import COMPILED, compile_proto
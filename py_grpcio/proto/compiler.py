@@ -0,0 +1,89 @@
+import sys
+
+from pathlib import Path
+from hashlib import sha256
+from types import ModuleType
+from importlib.resources import files
+from importlib.util import spec_from_file_location, module_from_spec
+
+from grpc import protos_and_services
+from grpc_tools import protoc
+from grpc_tools.grpc_version import VERSION as GRPC_TOOLS_VERSION
+
+type Compiled = tuple[ModuleType, ModuleType]
+
+COMPILED: dict[str, Compiled] = {}
+
+
+def proto_hash(proto: str) -> str:
+    return sha256(f'{GRPC_TOOLS_VERSION}\n{proto}'.encode()).hexdigest()
+
+
+def write_proto(path: Path, proto: str) -> None:
+    if not path.exists() or path.read_text() != proto:
+        path.write_text(data=proto)
+
+
+def load_module(name: str, path: Path) -> ModuleType:
+    module: ModuleType = module_from_spec(spec := spec_from_file_location(name=name, location=path))
+    sys.modules[name]: ModuleType = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def persisted_paths(path: Path) -> tuple[Path, Path, Path]:
+    return (
+        path.with_suffix('.sha256'),
+        path.with_name(f'{path.stem}_pb2.py'),
+        path.with_name(f'{path.stem}_pb2_grpc.py')
+    )
+
+
+def remove_persisted(path: Path) -> None:
+    stamp, protos_path, services_path = persisted_paths(path=path)
+    if stamp.exists():
+        for generated_path in (stamp, protos_path, services_path):
+            generated_path.unlink(missing_ok=True)
+
+
+def load_persisted(path: Path, digest: str) -> Compiled | None:
+    stamp, protos_path, services_path = persisted_paths(path=path)
+    if not (stamp.exists() and protos_path.exists() and services_path.exists()) or stamp.read_text() != digest:
+        return None
+    return (
+        load_module(name=protos_path.stem, path=protos_path),
+        load_module(name=services_path.stem, path=services_path)
+    )
+
+
+def persist(path: Path, digest: str) -> Compiled:
+    include: Path = Path(str(files('grpc_tools') / '_proto'))
+    code: int = protoc.main([
+        'grpc_tools.protoc',
+        f'-I{path.parent}',
+        f'-I{include}',
+        f'--python_out={path.parent}',
+        f'--grpc_python_out={path.parent}',
+        str(path)
+    ])
+    if code != 0:
+        raise RuntimeError(f'protoc failed to compile `{path}` with exit code {code}')
+    path.with_suffix('.sha256').write_text(data=digest)
+    return load_persisted(path=path, digest=digest)
+
+
+def compile_proto(path: Path, proto: str, persisted: bool = False) -> Compiled:
+    digest: str = proto_hash(proto=proto)
+    if compiled := COMPILED.get(digest):
+        return compiled
+    if compiled := load_persisted(path=path, digest=digest):
+        COMPILED[digest]: Compiled = compiled
+        return compiled
+    remove_persisted(path=path)
+    write_proto(path=path, proto=proto)
+    if persisted:
+        compiled: Compiled = persist(path=path, digest=digest)
+    else:
+        compiled: Compiled = protos_and_services(protobuf_path=str(path))
+    COMPILED[digest]: Compiled = compiled
+    return compiled
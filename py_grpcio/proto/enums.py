@@ -18,3 +18,4 @@ class ProtoBufTypes(StrEnum):
     STRING: str = 'string'
     BYTES: str = 'bytes'
     MAP: str = 'map'
+    TIMESTAMP: str = 'google.protobuf.Timestamp'
@@ -4,11 +4,13 @@ from inspect import isclass
 from datetime import date, time, datetime
 
 from pydantic import BaseModel
+from pydantic.fields import FieldInfo  # noqa: FieldInfo
 
 from types import UnionType, NoneType, GenericAlias
-from typing import Any, Annotated, Union, Iterable, get_origin
+from typing import Any, Annotated, Union, Iterable, get_origin, get_args
 
 from py_grpcio.proto import ProtoBufTypes
+from py_grpcio.ndarray import is_ndarray
 
 TYPE_MAPPING: dict[type, ProtoBufTypes] = {
     int: ProtoBufTypes.INT64,
@@ -24,22 +26,99 @@ TYPE_MAPPING: dict[type, ProtoBufTypes] = {
     datetime: ProtoBufTypes.STRING,
 }
 
+INTEGER_TYPES: frozenset[ProtoBufTypes] = frozenset({
+    ProtoBufTypes.INT32, ProtoBufTypes.INT64, ProtoBufTypes.UINT32, ProtoBufTypes.UINT64,
+    ProtoBufTypes.SINT32, ProtoBufTypes.SINT64, ProtoBufTypes.FIXED32, ProtoBufTypes.FIXED64,
+    ProtoBufTypes.SFIXED32, ProtoBufTypes.SFIXED64,
+})
 
-def parse_type(field_name: str, python_value: Any, field_type: type, allow_model: bool = True) -> ProtoBufTypes | str:
-    if python_value in TYPE_MAPPING:
+TYPE_OVERRIDES: dict[type, frozenset[ProtoBufTypes]] = {
+    int: INTEGER_TYPES,
+    float: frozenset({ProtoBufTypes.DOUBLE, ProtoBufTypes.FLOAT}),
+    UUID: frozenset({ProtoBufTypes.STRING, ProtoBufTypes.BYTES}),
+    datetime: frozenset({ProtoBufTypes.STRING, ProtoBufTypes.INT64, ProtoBufTypes.TIMESTAMP}),
+}
+
+NDARRAY_TYPES: dict[str, ProtoBufTypes] = {
+    'float64': ProtoBufTypes.DOUBLE,
+    'float32': ProtoBufTypes.FLOAT,
+    'int64': ProtoBufTypes.SFIXED64,
+    'int32': ProtoBufTypes.SFIXED32,
+    'uint64': ProtoBufTypes.FIXED64,
+    'uint32': ProtoBufTypes.FIXED32,
+    'bool': ProtoBufTypes.BOOL,
+}
+
+PROTO_IMPORTS: dict[ProtoBufTypes, str] = {
+    ProtoBufTypes.TIMESTAMP: 'google/protobuf/timestamp.proto',
+}
+
+
+def get_proto_type(annotation: Any) -> ProtoBufTypes | None:
+    origin: Any = get_origin(annotation)
+    if origin is Annotated:
+        for metadata in annotation.__metadata__:
+            if isinstance(metadata, ProtoBufTypes):
+                return metadata
+        return get_proto_type(annotation=get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        if len(args := [arg for arg in get_args(annotation) if arg is not NoneType]) == 1:
+            return get_proto_type(annotation=args[0])
+    return None
+
+
+def get_field_type(field_info: FieldInfo) -> Any:
+    for metadata in field_info.metadata:
+        if isinstance(metadata, ProtoBufTypes):
+            return Annotated[field_info.annotation, metadata]
+    return field_info.annotation
+
+
+def resolve_type(field_name: str, python_value: type, proto_type: ProtoBufTypes | None) -> ProtoBufTypes:
+    if proto_type is None:
         return TYPE_MAPPING[python_value]
+    if proto_type not in TYPE_OVERRIDES.get(python_value, ()):
+        raise TypeError(f'Field `{field_name}`: type `{python_value.__name__}` can not be encoded as `{proto_type}`.')
+    return proto_type
+
+
+def parse_type(
+    field_name: str,
+    python_value: Any,
+    field_type: type,
+    allow_model: bool = True,
+    proto_type: ProtoBufTypes | None = None
+) -> ProtoBufTypes | str:
+    if python_value in TYPE_MAPPING:
+        return resolve_type(field_name=field_name, python_value=python_value, proto_type=proto_type)
     elif (origin := get_origin(python_value)) is not None and origin in (Annotated, Union, UnionType):
         return parse_type_union(
             field_name=field_name,
             field_type=python_value,
-            args=list(python_value.__args__)
+            args=list(python_value.__args__),
+            proto_type=get_proto_type(annotation=python_value) or proto_type
         )['type']
+    elif proto_type is not None:
+        raise TypeError(f'Field `{field_name}`: type `{python_value}` can not be encoded as `{proto_type}`.')
+    elif is_ndarray(annotation=python_value):
+        if python_value.dtype is not None:
+            raise TypeError(
+                f'Field `{field_name}`: packed `{python_value.__name__}` can not be nested in `{field_type}`.'
+            )
+        return 'NDArrayMessage'
     elif allow_model and isclass(python_value) and issubclass(python_value, BaseModel):
         return python_value.__name__
+    elif isclass(python_value) and issubclass(python_value, Enum):
+        return ProtoBufTypes.STRING
     raise TypeError(f'Field `{field_name}`: unsupported type `{python_value}` in type `{field_type}`.')
 
 
-def parse_type_union(field_name: str, field_type: type | None | GenericAlias, args: list) -> dict[str, Any]:
+def parse_type_union(
+    field_name: str,
+    field_type: type | None | GenericAlias,
+    args: list,
+    proto_type: ProtoBufTypes | None = None
+) -> dict[str, Any]:
     if NoneType in args:
         args.remove(NoneType)
     if len(args) != 1:
@@ -47,42 +126,79 @@ def parse_type_union(field_name: str, field_type: type | None | GenericAlias, ar
             f'Field `{field_name}`: type `{field_type}` must have only one subtype, not {len(args)}. '
             'Tip: None/Optional type ignoring.'
         )
-    return {'name': field_name, 'type': parse_type(field_name=field_name, python_value=args[0], field_type=field_type)}
+    return {
+        'name': field_name,
+        'type': parse_type(field_name=field_name, python_value=args[0], field_type=field_type, proto_type=proto_type)
+    }
 
 
-def parse_type_sequence(field_name: str, field_type: type | None | GenericAlias, args: list) -> dict[str, Any]:
+def parse_type_sequence(
+    field_name: str,
+    field_type: type | None | GenericAlias,
+    args: list,
+    proto_type: ProtoBufTypes | None = None
+) -> dict[str, Any]:
     if len(args) != 1:
         raise TypeError(f'Field `{field_name}`: type `{field_type}` must have only one subtype, not {len(args)}.')
     return {
         'name': field_name,
-        'type': parse_type(field_name=field_name, python_value=args[0], field_type=field_type),
+        'type': parse_type(field_name=field_name, python_value=args[0], field_type=field_type, proto_type=proto_type),
         'repeated': True
     }
 
 
-def parse_type_mapping(field_name: str, field_type: type | None | GenericAlias, args: list) -> dict[str, Any]:
+def parse_type_mapping(
+    field_name: str,
+    field_type: type | None | GenericAlias,
+    args: list,
+    proto_type: ProtoBufTypes | None = None
+) -> dict[str, Any]:
     if len(args) != 2:
         raise TypeError(f'Field `{field_name}`: type `{field_type}` must have two subtypes, not {len(args)}')
     return {
         'name': field_name,
         'type': ProtoBufTypes.MAP,
         'map_key': parse_type(field_name=field_name, python_value=args[0], field_type=field_type, allow_model=False),
-        'map_value': parse_type(field_name=field_name, python_value=args[1], field_type=field_type)
+        'map_value': parse_type(
+            field_name=field_name,
+            python_value=args[1],
+            field_type=field_type,
+            proto_type=proto_type
+        )
     }
 
 
-def parse_field_type(field_name: str, field_type: type) -> dict[str, Any]:
-    if proto_buf_type := TYPE_MAPPING.get(field_type):
-        return {'name': field_name, 'type': proto_buf_type}
-    elif isinstance(field_type, GenericAlias) and (origin := get_origin(tp=field_type)) is not None:
+def parse_field_type(field_name: str, field_type: type, proto_type: ProtoBufTypes | None = None) -> dict[str, Any]:
+    if field_type in TYPE_MAPPING:
+        return {
+            'name': field_name,
+            'type': resolve_type(field_name=field_name, python_value=field_type, proto_type=proto_type)
+        }
+    elif (origin := get_origin(tp=field_type)) is not None:
         args: list = list(field_type.__args__)
+        if origin is Annotated:
+            return parse_field_type(
+                field_name=field_name,
+                field_type=args[0],
+                proto_type=get_proto_type(annotation=field_type) or proto_type
+            )
         if origin in (Union, UnionType):
-            return parse_type_union(field_name=field_name, field_type=field_type, args=args)
+            if len(types := [arg for arg in args if arg is not NoneType]) == 1 and is_ndarray(annotation=types[0]):
+                return parse_field_type(field_name=field_name, field_type=types[0], proto_type=proto_type)
+            return parse_type_union(field_name=field_name, field_type=field_type, args=args, proto_type=proto_type)
+        if not isclass(origin):
+            raise TypeError(f'Field unsupported type `{field_type}`')
         if issubclass(origin, dict):
-            return parse_type_mapping(field_name=field_name, field_type=field_type, args=args)
+            return parse_type_mapping(field_name=field_name, field_type=field_type, args=args, proto_type=proto_type)
         if issubclass(origin, Iterable):
-            return parse_type_sequence(field_name=field_name, field_type=field_type, args=args)
+            return parse_type_sequence(field_name=field_name, field_type=field_type, args=args, proto_type=proto_type)
         raise TypeError(f'Field unsupported type `{field_type}`')
+    elif proto_type is not None:
+        raise TypeError(f'Field `{field_name}`: type `{field_type}` can not be encoded as `{proto_type}`.')
+    elif is_ndarray(annotation=field_type):
+        if field_type.dtype is None:
+            return {'name': field_name, 'type': 'NDArrayMessage'}
+        return {'name': field_name, 'type': NDARRAY_TYPES[field_type.dtype], 'repeated': True}
     elif isclass(field_type):
         if issubclass(field_type, BaseModel):
             return {'name': field_name, 'type': field_type.__name__}
@@ -1,17 +1,32 @@
 from pathlib import Path
 
-from types import ModuleType
+from types import ModuleType, FrameType
 from typing import Callable, Awaitable
 
-from asyncio import AbstractEventLoop, Event, set_event_loop, new_event_loop
+from threading import current_thread, main_thread
+from multiprocessing import get_context
+from multiprocessing.context import ForkProcess
+from signal import signal, SIGINT, SIGTERM, SIG_IGN
+
+from asyncio import AbstractEventLoop, Event, set_event_loop
 
 from loguru import logger
 
+from grpc import Compression
 from grpc.aio import server
 from grpc.aio._server import Server  # noqa: _server
 
 from py_grpcio.service import BaseService
 from py_grpcio.middleware import BaseMiddleware
+from py_grpcio.executors import ExecutorPools
+from py_grpcio.limiter import ConcurrencyLimiter
+from py_grpcio.metrics import BaseMetricsExporter
+from py_grpcio.cache import ResponseCache
+from py_grpcio.enums import Compressions, EventLoops
+from py_grpcio.compression import DEFAULT_COMPRESSION_THRESHOLD, grpc_compression
+from py_grpcio.options import ServerOptions
+from py_grpcio.loop import get_loop_factory
+from py_grpcio.access_log import AccessLog
 from py_grpcio.interceptor import ServerInterceptor
 
 type ServerType = BaseServer
@@ -28,24 +43,55 @@ class BaseServer:
         on_startup: LifespanFunc | None = None,
         on_shutdown: LifespanFunc | None = None,
         loop: AbstractEventLoop | None = None,
-        loop_factory: Callable[..., AbstractEventLoop] = new_event_loop,
+        loop_factory: Callable[..., AbstractEventLoop] | None = None,
+        event_loop: EventLoops = EventLoops.ASYNCIO,
         shutdown_event: Event | None = None,
+        persisted_protos: bool = False,
+        grace_period: float | None = None,
+        thread_workers: int | None = None,
+        process_workers: int | None = None,
+        max_concurrent_rpcs: int | None = None,
+        max_queued_rpcs: int = 0,
+        metrics: BaseMetricsExporter | None = None,
+        access_log: AccessLog | None = None,
+        cache: ResponseCache | None = None,
+        compression: Compressions | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        options: ServerOptions | None = None,
     ):
         self.port: int = port
         self.proto_dir: Path = proto_dir
         self.proto_dir.mkdir(exist_ok=True)
+        self.persisted_protos: bool = persisted_protos
 
-        self.loop: AbstractEventLoop = loop or loop_factory()
+        self.loop_factory: Callable[..., AbstractEventLoop] = (
+            loop_factory if loop_factory is not None else get_loop_factory(event_loop=event_loop)
+        )
+        self.loop: AbstractEventLoop | None = loop
         self.shutdown_event: Event | None = shutdown_event
-        set_event_loop(self.loop)
+        self.grace_period: float | None = grace_period
 
-        self.server: Server = server(interceptors=[ServerInterceptor()])
+        self.server: Server | None = None
+        self.workers: list[ForkProcess] = []
 
         self.services: dict[str, type[BaseService]] = {}
 
         self.__protos: dict[str, ModuleType] = {}
         self.__services: dict[str, ModuleType] = {}
         self.middlewares: set[type[BaseMiddleware]] = middlewares or set()
+        self.executor_pools: ExecutorPools = ExecutorPools(
+            thread_workers=thread_workers,
+            process_workers=process_workers
+        )
+        self.metrics: BaseMetricsExporter | None = metrics
+        self.access_log: AccessLog = access_log if access_log is not None else AccessLog()
+        self.cache: ResponseCache | None = cache
+        self.compression: Compressions | None = compression
+        self.compression_threshold: int = compression_threshold
+        self.options: ServerOptions = options if options is not None else ServerOptions()
+        self.limiter: ConcurrencyLimiter | None = None
+        if max_concurrent_rpcs is not None:
+            self.limiter: ConcurrencyLimiter = ConcurrencyLimiter(limit=max_concurrent_rpcs, queue_size=max_queued_rpcs)
 
         self.on_startup: LifespanFunc | None = on_startup
         self.on_shutdown: LifespanFunc | None = on_shutdown
@@ -53,20 +99,71 @@ class BaseServer:
     def add_service(self, service: type[BaseService]) -> None:
         self.services[service.name]: type[BaseService] = service
         service.set_middlewares(middlewares=self.middlewares)
-        service.init_protos_and_services(proto_dir=self.proto_dir)
+        service.set_executor_pools(executor_pools=self.executor_pools)
+        service.set_limiter(limiter=self.limiter)
+        service.set_metrics(metrics=self.metrics)
+        service.set_cache(cache=self.cache)
+        service.init_protos_and_services(proto_dir=self.proto_dir, persisted=self.persisted_protos)
         self.__protos[service.name], self.__services[service.name] = service.protos, service.services
-        getattr(service.services, f'add_{service.name}Servicer_to_server')(servicer=service, server=self.server)
+
+    @property
+    def compression_enabled(self) -> bool:
+        return self.compression is not None or any(
+            method.compression is not None for service in self.services.values() for method in service.methods.values()
+        )
+
+    def create_server(self, reuse_port: bool = False) -> Server:
+        compression_enabled: bool = self.compression_enabled
+        default_compression: Compression | None = (
+            grpc_compression(compression=self.compression or Compressions.GZIP) if compression_enabled else None
+        )
+        for service in self.services.values():
+            service.set_compression(
+                compression=self.compression,
+                threshold=self.compression_threshold,
+                enabled=compression_enabled
+            )
+        self.server: Server = server(
+            interceptors=[ServerInterceptor(metrics=self.metrics, access_log=self.access_log)],
+            options=[*self.options.to_grpc(), ('grpc.so_reuseport', int(reuse_port))],
+            compression=default_compression
+        )
+        for service in self.services.values():
+            getattr(service.services, f'add_{service.name}Servicer_to_server')(servicer=service, server=self.server)
+        self.server.add_insecure_port(address=f'[::]:{self.port}')
+        return self.server
 
     async def start_server(self) -> None:
         await self.server.start()
         logger.info('Server has been launched!')
         if self.shutdown_event is not None:
             await self.shutdown_event.wait()
-            await self.server.stop(None)
+            await self.server.stop(self.grace_period)
         await self.server.wait_for_termination()
 
-    def run(self) -> None:
-        self.server.add_insecure_port(address=f'[::]:{self.port}')
+    def run(self, workers: int = 1) -> None:
+        if workers > 1:
+            return self.run_workers(workers=workers)
+        if self.loop is None:
+            self.loop: AbstractEventLoop = self.loop_factory()
+        set_event_loop(self.loop)
+        self.create_server()
+        self.handle_signals()
+        self.serve()
+
+    def handle_signals(self) -> None:
+        if current_thread() is not main_thread():
+            return
+        shutdown_event: Event = self.shutdown_event if self.shutdown_event is not None else Event()
+        try:
+            for signal_number in (SIGINT, SIGTERM):
+                self.loop.add_signal_handler(signal_number, shutdown_event.set)
+        except NotImplementedError:
+            # loops without signal handlers (Windows) are stopped by KeyboardInterrupt in serve()
+            return
+        self.shutdown_event: Event = shutdown_event
+
+    def serve(self) -> None:
         try:
             logger.info('Server starts up...')
             if self.on_startup:
@@ -77,5 +174,43 @@ class BaseServer:
         finally:
             if self.on_shutdown:
                 self.loop.run_until_complete(future=self.on_shutdown(self))
+            self.executor_pools.shutdown()
+            self.access_log.close()
             logger.info('Server is stopped!')
             self.loop.stop()
+
+    def run_worker(self) -> None:
+        signal(SIGINT, SIG_IGN)
+        self.loop: AbstractEventLoop = self.loop_factory()
+        set_event_loop(self.loop)
+        self.shutdown_event: Event = Event()
+        try:
+            self.loop.add_signal_handler(SIGTERM, self.shutdown_event.set)
+        except NotImplementedError:
+            self.shutdown_event = None
+        self.create_server(reuse_port=True)
+        self.serve()
+
+    def run_workers(self, workers: int) -> None:
+        context = get_context('fork')
+        self.workers: list[ForkProcess] = [
+            context.Process(target=self.run_worker, name=f'py-grpcio-worker-{index}') for index in range(workers)
+        ]
+        logger.info(f'Server starts up {workers} workers on port {self.port}...')
+        for worker in self.workers:
+            worker.start()
+        signal(SIGTERM, self.stop_workers)
+        try:
+            for worker in self.workers:
+                worker.join()
+        except KeyboardInterrupt:
+            self.stop_workers()
+            for worker in self.workers:
+                worker.join()
+        finally:
+            logger.info('Server is stopped!')
+
+    def stop_workers(self, _signal: int | None = None, _frame: FrameType | None = None) -> None:
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
@@ -1,6 +1,10 @@
-from typing import Any
 from pathlib import Path
+from types import TracebackType
 
+from py_grpcio.cache import ResponseCache
+from py_grpcio.options import ChannelOptions
+from py_grpcio.channel import ChannelPool
+from py_grpcio.balancer import LoadBalancer
 from py_grpcio.models import Method
 from py_grpcio.method import ClientMethodGRPC
 from py_grpcio.service.meta import BaseServiceMeta
@@ -14,23 +18,63 @@ class BaseService(metaclass=BaseServiceMeta):
         host: str = 'localhost',
         port: int = 50051,
         proto_dir: Path = Path('proto'),
-        timeout_delay: Delay = 1
+        timeout_delay: Delay = 1,
+        channels: int = 1,
+        persisted_protos: bool = False,
+        cache: ResponseCache | None = None,
+        timeouts: dict[str, Delay | None] | None = None,
+        endpoints: list[str] | None = None,
+        options: ChannelOptions | None = None
     ):
         self.host: str = host
         self.port: int = port
         self.proto_dir: Path = proto_dir
         self.proto_dir.mkdir(exist_ok=True)
         self.timeout_delay: Delay = timeout_delay
-        self.__class__.init_protos_and_services(proto_dir=self.proto_dir)
-
-    def __getattribute__(self: 'BaseService', attr_name: str) -> ClientMethodGRPC | Any:
-        methods: dict[str, Method] = super().__getattribute__('methods')
-        if method := methods.get(attr_name):
-            return ClientMethodGRPC(
-                method=method,
+        self.timeouts: dict[str, Delay | None] = timeouts or {}
+        self.__class__.init_protos_and_services(proto_dir=self.proto_dir, persisted=persisted_protos)
+        self.endpoints: list[str] = endpoints or [f'{self.host}:{self.port}']
+        if len(self.endpoints) > 1:
+            self.channel_pool: LoadBalancer = LoadBalancer(
+                targets=self.endpoints,
+                services=self.services,
                 service_name=self.name,
-                host=self.host,
-                port=self.port,
-                timeout_delay=self.timeout_delay
+                size=channels,
+                channel_options=options
             )
-        return super().__getattribute__(attr_name)
+        else:
+            self.channel_pool: ChannelPool = ChannelPool(
+                target=self.endpoints[0],
+                services=self.services,
+                service_name=self.name,
+                size=channels,
+                channel_options=options
+            )
+        for method_name, method in self.methods.items():
+            setattr(self, method_name, ClientMethodGRPC(
+                method=method,
+                channel_pool=self.channel_pool,
+                timeout_delay=self.get_timeout_delay(method_name=method_name, method=method),
+                cache=cache
+            ))
+
+    def get_timeout_delay(self: 'BaseService', method_name: str, method: Method) -> Delay | None:
+        if method_name in self.timeouts:
+            return self.timeouts[method_name]
+        if method.timeout is not None:
+            return method.timeout
+        return None if method.streaming else self.timeout_delay
+
+    async def close(self: 'BaseService', grace: float | None = None) -> None:
+        await self.channel_pool.close(grace=grace)
+
+    async def __aenter__(self: 'BaseService') -> 'BaseService':
+        return self
+
+    async def __aexit__(
+        self: 'BaseService',
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        await self.close()
@@ -1,19 +1,28 @@
 from abc import ABCMeta
 from pathlib import Path
 
-from types import ModuleType
+from functools import partial
+from types import ModuleType, FunctionType
 from typing import Any, Type, Unpack, TypedDict
 
 from jinja2 import Environment, FileSystemLoader, Template
 
-from grpc import protos_and_services
-
 from py_grpcio.__meta__ import __module_path__
 
-from py_grpcio.enums import ServiceModes
+from py_grpcio.enums import ServiceModes, Executors, Compressions
+from py_grpcio.codec import BaseCodec, JsonCodec
 from py_grpcio.models import Message, Method
-from py_grpcio.method import ServerMethodGRPC
+from py_grpcio.method import ServerMethodGRPC, ServerBatchMethodGRPC
+from py_grpcio.decorators import get_method_options
+from py_grpcio.exceptions import MethodSignatureException
+from py_grpcio.converter import compile_converters
 from py_grpcio.middleware import BaseMiddleware
+from py_grpcio.executors import ExecutorPools
+from py_grpcio.limiter import ConcurrencyLimiter
+from py_grpcio.metrics import BaseMetricsExporter
+from py_grpcio.cache import ResponseCache
+from py_grpcio.compression import DEFAULT_COMPRESSION_THRESHOLD
+from py_grpcio.proto import PROTO_IMPORTS, compile_proto
 
 from py_grpcio.utils import is_method, camel_to_snake, snake_to_camel
 
@@ -25,6 +34,10 @@ environment: Environment = Environment(
 
 class ExtraKwargs(TypedDict, total=False):
     mode: ServiceModes
+    codec: BaseCodec
+    executor: Executors
+    compression: Compressions
+    compression_threshold: int
 
 
 class BaseServiceMeta(ABCMeta):
@@ -51,50 +64,170 @@ class BaseServiceMeta(ABCMeta):
         bases: tuple,
         class_dict: dict[str, Any],
         mode: ServiceModes | None = None,
+        codec: BaseCodec | None = None,
+        executor: Executors | None = None,
+        compression: Compressions | None = None,
+        compression_threshold: int | None = None,
         **_extra: Unpack[ExtraKwargs]
     ):
         super().__init__(name, bases, class_dict)
         cls.name: str = name
         cls.mode: ServiceModes = mode if mode is not None else class_dict.get('mode', ServiceModes.DEFAULT)
+        cls.codec: BaseCodec = codec if codec is not None else class_dict.get('codec', JsonCodec())
+        cls.executor: Executors | None = executor if executor is not None else class_dict.get('executor')
+        cls.compression: Compressions | None = (
+            compression if compression is not None else class_dict.get('compression')
+        )
+        cls.compression_threshold: int | None = (
+            compression_threshold if compression_threshold is not None else class_dict.get('compression_threshold')
+        )
+        cls.server_compression: Compressions | None = None
+        cls.server_compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+        cls.server_compression_enabled: bool = False
         cls.methods: dict[str, Method] = {}
         cls.messages: dict[str, Type[Message]] = {}
+        cls.proto: str | None = None
         cls.protos: ModuleType | None = None
         cls.services: ModuleType | None = None
         cls.middlewares: set[Type[BaseMiddleware]] = set()
+        cls.executor_pools: ExecutorPools = ExecutorPools()
+        cls.limiter: ConcurrencyLimiter | None = None
+        cls.metrics: BaseMetricsExporter | None = None
+        cls.cache: ResponseCache | None = None
+        cls.server_methods: dict[str, ServerMethodGRPC | ServerBatchMethodGRPC] = {}
 
-    def __getattr__(self, attr_name: str) -> ServerMethodGRPC | Any:
-        if method := self.methods.get(camel_to_snake(string=attr_name)):
-            return ServerMethodGRPC(method=method, middlewares=self.middlewares)
-        return getattr(self, attr_name)
+    def __getattr__(self, attr_name: str) -> ServerMethodGRPC | ServerBatchMethodGRPC:
+        if server_method := self.get_method(method_name=attr_name):
+            return server_method
+        raise AttributeError(f'type object `{self.__name__}` has no attribute `{attr_name}`')
 
     def set_middlewares(self, middlewares: set[Type[BaseMiddleware]]) -> None:
         self.middlewares: set[Type[BaseMiddleware]] = middlewares
+        self.server_methods.clear()
+
+    def set_executor_pools(self, executor_pools: ExecutorPools) -> None:
+        self.executor_pools: ExecutorPools = executor_pools
+        self.server_methods.clear()
+
+    def set_limiter(self, limiter: ConcurrencyLimiter | None) -> None:
+        self.limiter: ConcurrencyLimiter | None = limiter
+        self.server_methods.clear()
+
+    def set_metrics(self, metrics: BaseMetricsExporter | None) -> None:
+        self.metrics: BaseMetricsExporter | None = metrics
+        self.server_methods.clear()
+
+    def set_compression(self, compression: Compressions | None, threshold: int, enabled: bool = False) -> None:
+        self.server_compression: Compressions | None = compression
+        self.server_compression_threshold: int = threshold
+        self.server_compression_enabled: bool = enabled
+        self.server_methods.clear()
+
+    def set_cache(self, cache: ResponseCache | None) -> None:
+        self.cache: ResponseCache | None = cache
+        self.server_methods.clear()
 
     def methods_and_messages(self) -> None:
+        if self.methods:
+            return
+        batch_handlers: dict[str, FunctionType] = {}
         for method_name, target in self.__dict__.items():
-            if is_method(method=target):
-                method: Method = Method.from_target(target=target, mode=self.mode)
-                self.methods[method_name]: Method = method
-                self.messages.update(method.messages)
+            if not is_method(method=target):
+                continue
+            if batch_for := get_method_options(func=target).get('batch_for'):
+                batch_handlers[batch_for]: FunctionType = target
+                continue
+            method: Method = Method.from_target(
+                target=target,
+                mode=self.mode,
+                codec=self.codec,
+                executor=self.executor,
+                compression=self.compression,
+                compression_threshold=self.compression_threshold
+            )
+            self.methods[method_name]: Method = method
+            self.messages.update(method.messages)
+        for method_name, method in self.methods.items():
+            if method.batched and f'{method_name}_batch' in self.methods:
+                raise MethodSignatureException(
+                    text=f'Method `{self.name}.{method_name}_batch` clashes with the batch rpc of `{method_name}`'
+                )
+        for method_name, target in batch_handlers.items():
+            if (method := self.methods.get(method_name)) is None or not method.batched:
+                raise MethodSignatureException(
+                    text=f'Batch handler `{target.__qualname__}` targets `{method_name}`, which is not a batched method'
+                )
+            method.batch_target = partial(target, self=target.__class__)
+            method.batch_executor = Method.parse_executor(
+                target=target,
+                executor=get_method_options(func=target).get('executor'),
+                default=self.executor,
+                streaming=False
+            )
+
+    def get_imports(self) -> list[str]:
+        return sorted({
+            PROTO_IMPORTS[field_type]
+            for message in self.messages.values()
+            for field in message.fields()
+            for field_type in (field.type, field.map_value)
+            if field_type in PROTO_IMPORTS
+        })
 
     def get_proto(self) -> str:
-        self.methods_and_messages()
-        template: Template = environment.get_template(name='service.proto.jinja2')
-        return template.render(
-            service=self,
-            camel_to_snake=camel_to_snake,
-            snake_to_camel=snake_to_camel
-        )
+        if self.proto is None:
+            self.methods_and_messages()
+            template: Template = environment.get_template(name='service.proto.jinja2')
+            self.proto: str = template.render(
+                service=self,
+                imports=self.get_imports(),
+                camel_to_snake=camel_to_snake,
+                snake_to_camel=snake_to_camel
+            )
+        return self.proto
+
+    def get_proto_path(self, proto_dir: Path) -> Path:
+        return proto_dir / f'{camel_to_snake(string=self.name)}.proto'
 
     def gen_proto(self, proto_dir: Path) -> Path:
-        path: Path = proto_dir / f'{camel_to_snake(string=self.name)}.proto'
+        path: Path = self.get_proto_path(proto_dir=proto_dir)
         path.write_text(data=self.get_proto())
         return path
 
-    def get_method(self, method_name: str) -> ServerMethodGRPC:
-        return ServerMethodGRPC(method=getattr(self, method_name), middlewares=self.middlewares)
-
-    def init_protos_and_services(self, proto_dir: Path) -> None:
-        self.protos, self.services = protos_and_services(protobuf_path=str(self.gen_proto(proto_dir=proto_dir)))
+    def get_method(self, method_name: str) -> ServerMethodGRPC | ServerBatchMethodGRPC | None:
+        if (server_methods := vars(self).get('server_methods')) is None:
+            return None
+        method_name: str = camel_to_snake(string=method_name)
+        if server_method := server_methods.get(method_name):
+            return server_method
+        if method_name.endswith('_batch') and (method := self.methods.get(method_name[:-6])) and method.batched:
+            server_methods[method_name] = ServerBatchMethodGRPC(
+                server_method=self.get_method(method_name=method_name[:-6]),
+                executor_pools=self.executor_pools
+            )
+            return server_methods[method_name]
+        if method := self.methods.get(method_name):
+            server_methods[method_name] = ServerMethodGRPC(
+                method=method,
+                middlewares=self.middlewares,
+                executor_pools=self.executor_pools,
+                limiter=self.limiter,
+                metrics=self.metrics,
+                cache=self.cache,
+                compression=self.server_compression,
+                compression_threshold=self.server_compression_threshold,
+                compression_enabled=self.server_compression_enabled
+            )
+            return server_methods[method_name]
+        return None
+
+    def init_protos_and_services(self, proto_dir: Path, persisted: bool = False) -> None:
+        self.protos, self.services = compile_proto(
+            path=self.get_proto_path(proto_dir=proto_dir),
+            proto=self.get_proto(),
+            persisted=persisted
+        )
         for method in self.methods.values():
+            if method.protos is not self.protos:
+                method.converters = compile_converters(messages=method.messages, protos=self.protos)
             method.protos, method.services = self.protos, self.services
@@ -0,0 +1,55 @@
+from collections.abc import Awaitable, Callable
+from asyncio import AbstractEventLoop, Task, CancelledError, shield, get_running_loop
+from typing import Any
+
+from py_grpcio.utils import request_digest
+
+type Call = Callable[[], Awaitable[Any]]
+
+
+class Flight:
+    def __init__(self: 'Flight', task: Task):
+        self.task: Task = task
+        self.waiters: int = 0
+
+
+class SingleFlight:
+    def __init__(self: 'SingleFlight', name: str):
+        self.name: str = name
+        self.flights: dict[bytes, Flight] = {}
+
+        self.calls: int = 0
+        self.shared: int = 0
+
+    @property
+    def stats(self: 'SingleFlight') -> dict[str, float]:
+        return {
+            'calls': self.calls,
+            'shared': self.shared,
+            'hit_ratio': self.shared / self.calls if self.calls else 0.0,
+        }
+
+    def release(self: 'SingleFlight', key: bytes, flight: Flight) -> None:
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+
+    async def do(self: 'SingleFlight', data: bytes, call: Call) -> Any:
+        key: bytes = request_digest(name=self.name, data=data)
+        loop: AbstractEventLoop = get_running_loop()
+        self.calls += 1
+        # a task can only be awaited on its own loop, callers on other loops start their own flight
+        if (flight := self.flights.get(key)) is not None and flight.task.get_loop() is loop:
+            self.shared += 1
+        else:
+            flight: Flight = Flight(task=loop.create_task(call()))
+            self.flights[key] = flight
+            flight.task.add_done_callback(lambda _: self.release(key=key, flight=flight))
+        flight.waiters += 1
+        try:
+            return await shield(flight.task)
+        except CancelledError:
+            if flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
@@ -1,15 +1,35 @@
 from re import findall, sub
+from hashlib import blake2b
+from functools import cache
 from types import FunctionType
+import signal
+
+DIGEST_SIZE: int = 16
 
 
 def is_method(method: FunctionType) -> bool:
     return isinstance(method, FunctionType) and not (method.__name__.startswith('__') or method.__name__.endswith('__'))
 
 
+@cache
 def camel_to_snake(string: str) -> str:
     words: list[str] = findall(pattern=r'[A-Z]?[a-z]+|[A-Z]{2,}(?=[A-Z][a-z]|\d|\W|$)|\d+', string=string)
     return '_'.join(map(lambda word: word.lower(), words))
 
 
+@cache
 def snake_to_camel(string: str) -> str:
     return sub(pattern=r'_([a-zA-Z])', repl=lambda match: match.group(1).upper(), string=string.title())
+
+
+def request_digest(name: str, data: bytes) -> bytes:
+    digest: blake2b = blake2b(name.encode(), digest_size=DIGEST_SIZE)
+    digest.update(b'\0')
+    digest.update(data)
+    return digest.digest()
+
+
+def block_signals() -> None:
+    # worker threads must not swallow SIGINT / SIGTERM meant to wake the event loop in the main thread
+    if hasattr(signal, 'pthread_sigmask'):
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})